@@ -14,6 +14,8 @@ from .const import (
     API_QUERIES_GET,
     API_QUERIES_GET_DHW,
     DEFAULT_SCAN_INTERVAL, 
+    CONF_MODBUS_STRICT_MODE,
+    DEFAULT_MODBUS_STRICT_MODE,
 )
 
 from .config_flow_modbus import (
@@ -552,6 +554,9 @@ class KronotermOptionsFlowHandler(config_entries.OptionsFlow):
                 options["scan_interval_seconds"] = user_input[
                     "scan_interval_seconds"
                 ]
+                options[CONF_MODBUS_STRICT_MODE] = user_input[
+                    CONF_MODBUS_STRICT_MODE
+                ]
                 options.pop("scan_interval", None)
                 return self.async_create_entry(title="", data=options)
 
@@ -561,6 +566,12 @@ class KronotermOptionsFlowHandler(config_entries.OptionsFlow):
                         "scan_interval_seconds",
                         default=scan_interval_seconds,
                     ): vol.All(vol.Coerce(int), vol.Range(min=5, max=600)),
+                    vol.Required(
+                        CONF_MODBUS_STRICT_MODE,
+                        default=current_options.get(
+                            CONF_MODBUS_STRICT_MODE, DEFAULT_MODBUS_STRICT_MODE
+                        ),
+                    ): bool,
                 }
             )
         else:
@@ -16,6 +16,10 @@ RETRY_DELAY_BASE = 2       # seconds (will be raised to power of attempt number)
 SHORTCUT_DELAY_DEFAULT = 2 # seconds to wait after setting a shortcut
 SHORTCUT_DELAY_STATE = 1   # seconds for heatpump_on state change
 
+# Read every register on its own, for controllers that reject multi-word reads
+CONF_MODBUS_STRICT_MODE = "modbus_strict_mode"
+DEFAULT_MODBUS_STRICT_MODE = False
+
 # ----------------------------------------------------------------------------
 # Modbus addresses for dedicated platforms (e.g., water_heater, climate)
 # ----------------------------------------------------------------------------
@@ -6,7 +6,8 @@ This file houses all Kronoterm base entity classes for improved maintainability.
 
 import logging
 import re
-from typing import Any, Dict, List, Optional, Union
+import sys
+from typing import Any, Dict, Iterable, Optional, Union
 
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
@@ -34,8 +35,13 @@ class KronotermModbusBase(CoordinatorEntity):
         device_info: Dict[str, Any],
     ) -> None:
         super().__init__(coordinator)
+        # Names repeat across every entity rebuild; interning lets HA's
+        # string-keyed registries compare them by identity.
+        name = sys.intern(name)
         self._address: int = address
         self._name_key: str = name  # Store as translation key
+        # Platforms pass coordinator.shared_device_info, so this is a shared
+        # reference rather than a per-entity copy.
         self._device_info: Dict[str, Any] = device_info
         self._unique_id: Optional[str] = None
         self._attr_has_entity_name = True
@@ -43,9 +49,12 @@ class KronotermModbusBase(CoordinatorEntity):
         self._attr_entity_id = f"{DOMAIN}.{name}"
 
     @property
-    def modbus_data(self) -> List[Dict[str, Any]]:
+    def modbus_data(self) -> Iterable[Dict[str, Any]]:
         """
         Safely return modbus data from coordinator.data["main"]["ModbusReg"].
+
+        The Modbus coordinator provides a view of its per-address entries
+        rather than a list, so callers may only iterate it.
         """
         if not self.coordinator.data:
             return []
@@ -57,6 +66,9 @@ class KronotermModbusBase(CoordinatorEntity):
         Retrieve the 'value' from the ModbusReg entry for self._address.
         Returns None if not found.
         """
+        # The Modbus coordinator keeps an address index of the latest poll
+        if hasattr(self.coordinator, "get_register_value"):
+            return self.coordinator.get_register_value(self._address)
         return next(
             (reg.get("value") for reg in self.modbus_data if reg.get("address") == self._address),
             None,
@@ -69,19 +81,14 @@ class KronotermModbusBase(CoordinatorEntity):
         raw_value = self._get_modbus_value()
         if raw_value is None:
             return None
-        try:
-            return self._process_value(raw_value)
-        except (ValueError, TypeError, AttributeError) as ex:
-            _LOGGER.debug(
-                "Error processing value for address %s (%s): %s",
-                self._address,
-                self._name_key,
-                ex,
-            )
-            return None
+        return self._process_value(raw_value)
 
     def _process_value(self, raw_value: Any) -> Any:
-        """Default pass-through. Subclasses may override for scaling, etc."""
+        """Default pass-through. Subclasses may override for scaling, etc.
+
+        Overrides validate their input and return None for values they cannot
+        parse instead of raising, so the common path runs without a try block.
+        """
         return raw_value
 
     @property
@@ -93,9 +100,9 @@ class KronotermModbusBase(CoordinatorEntity):
     def available(self) -> bool:
         """Available if the last update succeeded and coordinator data is present."""
         # We also check if the specific value is available in the modbus data
-        return bool(
-            self.coordinator.last_update_success 
-            and self.coordinator.data
+        return (
+            self.coordinator.last_update_success
+            and self.coordinator.data is not None
             and self._get_modbus_value() is not None
         )
 
@@ -122,10 +129,12 @@ class KronotermBinarySensor(KronotermModbusBase, BinarySensorEntity):
     ) -> None:
         super().__init__(coordinator, address, name, device_info)
         self._bit: Optional[int] = bit
+        # Resolved once so is_on tests a fixed mask instead of shifting per read
+        self._mask: Optional[int] = 1 << bit if bit is not None else None
         self._icon: Optional[str] = icon
         suffix = f"_{bit}" if bit is not None else ""
         # Use name-based unique_id to match Cloud API format (prevents duplicates on reconfigure)
-        self._unique_id = f"{coordinator.config_entry.entry_id}_{DOMAIN}_{name}{suffix}"
+        self._unique_id = sys.intern(f"{coordinator.config_entry.entry_id}_{DOMAIN}_{name}{suffix}")
 
     @property
     def unique_id(self) -> str:
@@ -142,8 +151,8 @@ class KronotermBinarySensor(KronotermModbusBase, BinarySensorEntity):
             raw_value = self._get_modbus_value()
             if raw_value is not None:
                 int_value = int(raw_value)
-                if self._bit is not None:
-                    return bool(int_value & (1 << self._bit))
+                if self._mask is not None:
+                    return bool(int_value & self._mask)
                 return bool(int_value)
         except (ValueError, TypeError, AttributeError) as ex:
             _LOGGER.error(
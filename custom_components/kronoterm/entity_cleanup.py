@@ -29,6 +29,18 @@ MODBUS_ONLY_ENTITIES = [
 ]
 
 
+def _collect_entries(
+    registry: er.EntityRegistry,
+    entry_id: str,
+) -> list[er.RegistryEntry]:
+    """Return only the registry entries that belong to one config entry.
+
+    Uses the registry's config-entry index instead of scanning every entity
+    Home Assistant knows about.
+    """
+    return er.async_entries_for_config_entry(registry, entry_id)
+
+
 async def disable_mode_specific_entities(
     hass: HomeAssistant,
     entry_id: str,
@@ -58,14 +70,10 @@ async def disable_mode_specific_entities(
     
     disabled_count = 0
     
-    # Iterate through all entities for this integration entry
-    for entity_id in list(registry.entities):
-        entity_entry = registry.entities.get(entity_id)
-        
-        # Skip if not from this config entry
-        if not entity_entry or entity_entry.config_entry_id != entry_id:
-            continue
-        
+    # Iterate through the entities of this integration entry only
+    for entity_entry in _collect_entries(registry, entry_id):
+        entity_id = entity_entry.entity_id
+
         # Check if this entity should be disabled
         if entity_id in entities_to_disable:
             if entity_entry.disabled_by != er.RegistryEntryDisabler.INTEGRATION:
@@ -110,14 +118,10 @@ async def enable_mode_specific_entities(
     
     enabled_count = 0
     
-    # Iterate through all entities for this integration entry
-    for entity_id in list(registry.entities):
-        entity_entry = registry.entities.get(entity_id)
-        
-        # Skip if not from this config entry
-        if not entity_entry or entity_entry.config_entry_id != entry_id:
-            continue
-        
+    # Iterate through the entities of this integration entry only
+    for entity_entry in _collect_entries(registry, entry_id):
+        entity_id = entity_entry.entity_id
+
         # Check if this entity should be re-enabled
         if entity_id in entities_to_enable:
             if entity_entry.disabled_by == er.RegistryEntryDisabler.INTEGRATION:
@@ -8,20 +8,28 @@ Alternative to cloud API for local control.
 import logging
 import asyncio
 import json
+import socket
 import time
 from datetime import timedelta
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, NamedTuple, Optional
 
 from pymodbus.client import AsyncModbusTcpClient, AsyncModbusSerialClient
-from pymodbus.exceptions import ModbusException
+from pymodbus.exceptions import ConnectionException, ModbusException
 
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.core import HomeAssistant
 from homeassistant.const import CONF_HOST, CONF_PORT
 from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN, DEFAULT_SCAN_INTERVAL
+from .const import (
+    CONF_MODBUS_STRICT_MODE,
+    DEFAULT_MODBUS_STRICT_MODE,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+)
 # All register definitions now come from kronoterm.json via RegisterMap
 # No more hardcoded Python constants needed!
 from .register_map import RegisterMap
@@ -33,8 +41,11 @@ from .value_utils import (
     is_pool_setpoint_available,
     is_pool_temperature_available,
     KronotermTcpPacketNormalizer,
+    MODBUS_MAX_READ_WORDS,
     PERFORMANCE_FACTOR_NAMES,
     normalize_performance_factor,
+    SignedWordDecoder,
+    UINT16_MASK,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -42,6 +53,96 @@ _LOGGER = logging.getLogger(__name__)
 # Modbus unit ID (slave address)
 DEFAULT_UNIT_ID = 20
 
+# Maximum number of batch reads awaited at the same time. pymodbus still
+# sends them one after another on the socket; this only bounds how many
+# coroutines queue for it.
+DEFAULT_PARALLEL_READS = 4
+
+# Batch coalescing limits. Every extra request costs an MBAP header and a
+# full round trip, which outweighs reading up to ~20 unused words in a gap.
+# Batches stay below the 125-register limit of a single FC03 read.
+BATCH_MAX_GAP = 20
+BATCH_MAX_SIZE = 120
+
+# (max_gap, max_batch) in strict mode: one register per request
+STRICT_BATCH_LIMITS = (0, 1)
+
+# Registers logged on every poll at debug level: system temperature
+# correction, return temperature, reservoir/solar setpoints, power sensors
+DEBUG_LOG_ADDRESSES = frozenset({
+    546, 553, 2001, 2007, 2014, 2023, 2024, 2034, 2051, 2101, 2102, 2103,
+    2110, 2129, 2130, 2160, 2161, 2187, 2188, 2189, 2190, 2191, 2305, 2327,
+    2329, 2371, 2372,
+})
+
+# Raw readings at or below this are Kronoterm sensor error codes
+# (e.g. -600 for a disconnected probe), not measurements
+SENSOR_ERROR_FLOOR = -500
+
+# Decimal scales applied as a single division. raw / 10 is already the
+# float nearest the decimal reading, so no rounding pass is needed.
+DECIMAL_SCALE_DIVISORS = {0.1: 10, 0.01: 100}
+
+# Loop temperatures and reservoir setpoint that decide the installed-equipment
+# flags; the flags are only latched once a poll returned all of them
+FEATURE_FLAG_ADDRESSES = (2110, 2111, 2112, 2034)
+
+# Seconds before a register the device rejected is probed again
+FAILED_REGISTER_RETRY = 600
+
+# hass.data key for parsed register maps shared across entries and reloads
+REGISTER_MAP_CACHE = f"{DOMAIN}_register_maps"
+
+# Seconds a writable (setting) register may go unread between polls.
+# Settings only change through writes or the controller panel, so fast
+# polls re-read the live measurements and carry settings over.
+SETTINGS_MAX_AGE = 60
+
+# Seconds a write waits for others from the same UI action to join it
+WRITE_COALESCE_DELAY = 0.02
+
+# Seconds between refreshes requested after writes. Written values are
+# applied to the polled data immediately, so the confirming scan can wait;
+# a slider drag or a script with delays then costs one scan per cooldown
+# instead of one per write.
+WRITE_REFRESH_COOLDOWN = 5.0
+
+# Delays (seconds) between reconnect attempts when the socket has dropped
+RECONNECT_BACKOFF = (0.1, 0.2, 0.5, 1.0)
+
+# Idle seconds before probing, probe interval and probe count
+TCP_KEEPALIVE_OPTIONS = (
+    ("TCP_KEEPIDLE", 30),
+    ("TCP_KEEPINTVL", 10),
+    ("TCP_KEEPCNT", 3),
+)
+
+
+class ReadBatch(NamedTuple):
+    """One FC03 read of the poll plan and how to decode its words."""
+
+    start: int
+    count: int
+    # (reg_def, offset, convert) for single-word registers
+    regs16: tuple
+    # (reg_def, high_offset, low_offset, convert) for Value32 counters
+    regs32: tuple
+
+
+def _raw_value(raw_value: int) -> int:
+    """Return a register value that is reported unscaled."""
+    return raw_value
+
+
+def _divided_value(divisor: int, raw_value: int) -> float:
+    """Scale a numeric register by a power-of-ten divisor."""
+    return raw_value / divisor
+
+
+def _scaled_value(scale: float, raw_value: int) -> float:
+    """Scale a numeric register, rounded to avoid float precision noise."""
+    return round(raw_value * scale, 2)
+
 
 class ModbusCoordinator(ModbusReadMixin, ModbusWriteMixin, DataUpdateCoordinator):
     """Coordinator to fetch data from Kronoterm via Modbus TCP."""
@@ -73,16 +174,45 @@ class ModbusCoordinator(ModbusReadMixin, ModbusWriteMixin, DataUpdateCoordinator
         self.client: Optional[AsyncModbusTcpClient] = None
         self._connected = False
         self._tcp_packet_normalizer = KronotermTcpPacketNormalizer()
+        # Socket that already has TCP_NODELAY/keepalive applied
+        self._tuned_socket = None
+        # Reused for every batch; decoding is synchronous so it is never shared
+        self._decode_signed_words = SignedWordDecoder()
+        # Caps batch reads waiting on the client at once
+        self._read_semaphore = asyncio.Semaphore(DEFAULT_PARALLEL_READS)
+        # Strict mode trades polling speed for devices that reject batches
+        self._strict_reads = config_entry.options.get(
+            CONF_MODBUS_STRICT_MODE, DEFAULT_MODBUS_STRICT_MODE
+        )
         self.last_successful_update = None
         self.last_update_duration_ms: float | None = None
         self.last_update_error: str | None = None
 
         # Register map will be loaded after auto-detect
         self.register_map: Optional[RegisterMap] = None
+        # Static read plan derived from register_map; rebuilt when it reloads
+        self._batch_plan: list[ReadBatch] = []
+        # Same plan without writable registers, used between settings reads
+        self._volatile_plan: list[ReadBatch] = []
+        self._settings_addresses: frozenset[int] = frozenset()
+        # Monotonic time of the last poll that read settings; None forces one
+        self._settings_read_at: float | None = None
+        # Monotonic time of the last successful poll
+        self._polled_at: float | None = None
+        # Addresses the device rejected individually -> monotonic time
+        self._failed_registers: Dict[int, float] = {}
         self._json_path = Path(__file__).parent / "kronoterm.json"
         self.register_set = "extended"
 
-        # Shared device info
+        # Writes being collected for one combined send: (values, result future)
+        self._pending_writes: Optional[tuple[Dict[int, int], asyncio.Future]] = None
+        # Held while a write batch is on the wire so batches never overlap
+        self._write_lock = asyncio.Lock()
+
+        # Address -> ModbusReg entry of the latest poll (O(1) value lookups)
+        self._reg_by_addr: Dict[int, Dict[str, Any]] = {}
+
+        # Shared device info (one dict referenced by every entity)
         self.shared_device_info: Dict[str, Any] = {}
         
         # Feature flags (to match cloud coordinator interface)
@@ -96,6 +226,8 @@ class ModbusCoordinator(ModbusReadMixin, ModbusWriteMixin, DataUpdateCoordinator
         self.alt_source_installed = False  # Alias for additional_source
         self.reservoir_installed = False
         self.pool_installed = False
+        # Set once the flags above were derived from a successful poll
+        self._feature_flags_detected = False
 
         # Scan interval (supports both seconds and legacy minutes)
         # Try new seconds-based setting first, fall back to minutes
@@ -117,6 +249,11 @@ class ModbusCoordinator(ModbusReadMixin, ModbusWriteMixin, DataUpdateCoordinator
             name="kronoterm_modbus_coordinator",
             update_method=self._async_update_data_with_metrics,
             update_interval=interval,
+            # Refreshes requested by writes share one delayed scan per
+            # cooldown instead of each triggering a full register scan.
+            request_refresh_debouncer=Debouncer(
+                hass, _LOGGER, cooldown=WRITE_REFRESH_COOLDOWN, immediate=False
+            ),
         )
 
     async def _async_update_data_with_metrics(self) -> Dict[str, Any]:
@@ -173,6 +310,7 @@ class ModbusCoordinator(ModbusReadMixin, ModbusWriteMixin, DataUpdateCoordinator
                 raise UpdateFailed(f"Failed to connect to Modbus device at {self.host}:{self.port}")
             
             self._connected = True
+            self._configure_socket()
             _LOGGER.info("Successfully connected to Modbus device")
 
             # Auto-detect register set before loading map
@@ -184,12 +322,8 @@ class ModbusCoordinator(ModbusReadMixin, ModbusWriteMixin, DataUpdateCoordinator
             # Load register map from JSON file asynchronously
             if not self.register_map:
                 try:
-                    def _read_json():
-                        with open(self._json_path, "r", encoding="utf-8") as f:
-                            return json.load(f)
-
-                    data = await self.hass.async_add_executor_job(_read_json)
-                    self.register_map = RegisterMap(data)
+                    self.register_map = await self._async_load_register_map()
+                    self._rebuild_batch_plans()
                     _LOGGER.debug(
                         "Loaded %s register map with %d registers",
                         self.register_set,
@@ -321,26 +455,35 @@ class ModbusCoordinator(ModbusReadMixin, ModbusWriteMixin, DataUpdateCoordinator
             
             # Use config_entry.entry_id as device identifier to maintain consistency
             # when switching between Cloud and Modbus connection types
-            self.shared_device_info = {
+            self._set_shared_device_info({
                 "identifiers": {(DOMAIN, self.config_entry.entry_id)},
                 "name": "Kronoterm",
                 "manufacturer": "Kronoterm",
                 "model": model_name,
                 "sw_version": firmware,
                 "configuration_url": f"http://{self.host}",
-            }
+            })
             
             _LOGGER.info("Device info: %s", self.shared_device_info)
             
         except Exception as err:
             _LOGGER.warning("Could not fetch device info: %s", err)
             # Use fallback device info
-            self.shared_device_info = {
+            self._set_shared_device_info({
                 "identifiers": {(DOMAIN, self.config_entry.entry_id)},
                 "name": "Kronoterm",
                 "manufacturer": "Kronoterm",
                 "model": self._format_model_name(),
-            }
+            })
+
+    def _set_shared_device_info(self, device_info: Dict[str, Any]) -> None:
+        """Replace the shared device info in place.
+
+        Every entity holds a reference to this one dict, so it is updated
+        rather than rebound to keep all entities pointing at the same object.
+        """
+        self.shared_device_info.clear()
+        self.shared_device_info.update(device_info)
 
     def _format_model_name(self) -> str:
         """Format model name for display."""
@@ -356,8 +499,7 @@ class ModbusCoordinator(ModbusReadMixin, ModbusWriteMixin, DataUpdateCoordinator
         """Fetch data from Modbus device."""
         _LOGGER.debug("Update data called, connected=%s", self._connected)
         
-        if not self._connected:
-            raise UpdateFailed("Modbus client not connected")
+        await self._async_ensure_connected()
 
         try:
             data = {}
@@ -366,158 +508,415 @@ class ModbusCoordinator(ModbusReadMixin, ModbusWriteMixin, DataUpdateCoordinator
             if not self.register_map:
                 raise UpdateFailed("Register map not loaded - cannot read registers")
             
-            # Always use register_map (no fallback)
-            # Read both sensors AND control registers (switches need control register values)
-            registers_to_read = self.register_map.get_sensors() + self.register_map.get_controls()
-            _LOGGER.debug("Reading %d registers using batch reads", len(registers_to_read))
-            
-            start_time = time.time()
+            # Sensors AND control registers are read (switches need control
+            # register values); the grouping only changes with the map.
+            self._expire_failed_registers()
+            if not self._batch_plan:
+                self._rebuild_batch_plans()
+            now = time.monotonic()
+            read_settings = (
+                self._settings_read_at is None
+                or now - self._settings_read_at >= SETTINGS_MAX_AGE
+            )
+            batches = self._batch_plan if read_settings else self._volatile_plan
+            register_count = sum(len(regs16) + len(regs32) for _, _, regs16, regs32 in batches)
+            _LOGGER.debug("Reading %d registers in %d batches", register_count, len(batches))
             
-            # Group registers into consecutive batches for efficient reading
-            batches = self._group_registers_into_batches(registers_to_read)
-            _LOGGER.debug("Grouped into %d batches", len(batches))
+            debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
+            start_time = time.perf_counter()
             
-            # Read all batches
+            # Read all batches concurrently; pymodbus still serializes the
+            # requests on the socket, but the awaits no longer stack up.
+            results = await asyncio.gather(
+                *(self._read_batch(batch.start, batch.count) for batch in batches),
+                return_exceptions=True,
+            )
+
+            responses = []
+            replacements = {}
+            for batch, result in zip(batches, results):
+                if isinstance(result, Exception):
+                    _LOGGER.debug("Exception reading batch at %d: %s", batch.start, result)
+                    if isinstance(result, (ConnectionException, OSError)):
+                        # Reconnect before the next poll, not on a later failure
+                        self._connected = False
+                elif result.isError():
+                    # An exception response usually means one address in the
+                    # batch is unsupported; recover the rest by splitting.
+                    _LOGGER.debug("Error reading batch at %d (count %d)", batch.start, batch.count)
+                    split_responses, sub_batches = await self._async_split_failed_batch(batch)
+                    responses.extend(split_responses)
+                    replacements[id(batch)] = sub_batches
+                else:
+                    responses.append((batch, result))
+            # Skipped when a rejected register already reset the plans
+            if replacements and self._batch_plan:
+                patched = self._replace_split_batches(batches, replacements)
+                if read_settings:
+                    self._batch_plan = patched
+                else:
+                    self._volatile_plan = patched
+
             register_values = {}
-            for batch_start, batch_count, batch_regs in batches:
-                try:
-                    # Read the entire batch in one Modbus request
-                    modbus_address = documented_to_modbus_address(batch_start)
-                    result = await self.client.read_holding_registers(
-                        modbus_address, count=batch_count, device_id=self.unit_id
-                    )
-                    
-                    if result.isError():
-                        _LOGGER.debug("Error reading batch at %d (count %d)", batch_start, batch_count)
-                        continue
-                    
-                    # Map results back to individual registers
-                    for i, reg_def in enumerate(batch_regs):
-                        if reg_def.type == "Value32":
-                            # For 32-bit registers, read both high and low
-                            high_addr = reg_def.register32_high
-                            low_addr = reg_def.register32_low
-                            
-                            high_offset = high_addr - batch_start
-                            low_offset = low_addr - batch_start
-                            
-                            # Check if both registers are in the batch
-                            if high_offset >= len(result.registers) or low_offset >= len(result.registers):
-                                _LOGGER.warning("32-bit register %d out of batch range (batch_start=%d, offsets=%d/%d, len=%d)", 
-                                               reg_def.address, batch_start, high_offset, low_offset, len(result.registers))
-                                continue
-                            
-                            high_value = result.registers[high_offset]
-                            low_value = result.registers[low_offset]
-                            
-                            _LOGGER.debug("32-bit %s: batch_start=%d, high_addr=%d (offset=%d, raw=%d), low_addr=%d (offset=%d, raw=%d)",
-                                           reg_def.name_en, batch_start, high_addr, high_offset, high_value, 
-                                           low_addr, low_offset, low_value)
-                            
-                            # Counters are unsigned 32-bit values split into
-                            # conventional high and low Modbus words.
-                            raw_value = combine_u16_words(high_value, low_value)
-                            
-                            _LOGGER.debug("32-bit %s: combined raw_value=%d", reg_def.name_en, raw_value)
-                        else:
-                            addr = reg_def.address
-                            offset = addr - batch_start
-                            raw_value = result.registers[offset]
-                            
-                            # Convert to signed integer
-                            if raw_value >= 32768:
-                                raw_value = raw_value - 65536
-                            
-                        # Check for error values
-                        if reg_def.type != "Value32" and raw_value <= -500:
-                            continue
-                        
-                        register_values[reg_def.address] = (reg_def, raw_value)
-                
-                except Exception as err:
-                    _LOGGER.debug("Exception reading batch at %d: %s", batch_start, err)
+            for (batch_start, batch_count, regs16, regs32), result in responses:
+                if len(result.registers) < batch_count:
+                    _LOGGER.warning("Short response for batch at %d (got %d of %d registers)",
+                                    batch_start, len(result.registers), batch_count)
                     continue
-                
-                read_time = time.time() - start_time
-                _LOGGER.debug("Batch read took %.2fs for %d registers in %d batches", 
-                              read_time, len(registers_to_read), len(batches))
-                
-                # Process results
-                for reg_def, raw_value in register_values.values():
-                    precision = 2
-                    # Process based on register type
-                    if reg_def.type == "Enum":
-                        value = raw_value
-                    elif reg_def.type == "Bitmask":
-                        value = raw_value
-                    elif reg_def.type in ("Status", "Control"):
-                        value = raw_value
-                    elif reg_def.name_en in PERFORMANCE_FACTOR_NAMES:
-                        value = normalize_performance_factor(raw_value)
-                        if value is None:
-                            continue
-                    else:
-                        # Scaled numeric value (Value or Value32)
-                        if reg_def.scale and reg_def.scale != 1.0:
-                            value = round(raw_value * reg_def.scale, precision)
-                        else:
-                            value = raw_value
-                    
-                    # Normalize floats to avoid precision noise
-                    if isinstance(value, float):
-                        value = round(value, precision)
-
-                    # Store in data dict using register address as key
-                    data[reg_def.address] = {
-                        "value": value,
-                        "raw": raw_value,
-                        "name": reg_def.name_en,
-                        "unit": reg_def.unit,
-                    }
-                    
-                    # Debug logging for critical sensors
-                    if reg_def.address in [2014, 2371, 2372, 2327, 2103, 2001, 2007, 2023, 2187, 2191, 546, 553, 
-                                          2130, 2160, 2110, 2161, 2102, 2024, 2051, 2188, 2189, 2190,
-                                          2101, 2034, 2305, 2129, 2329]:  # system_temperature_correction, return_temp, reservoir_current_setpoint, solar_reservoir_setpoint, power sensors
-                        _LOGGER.debug("Register %d (%s): raw=%d, scaled=%s, scale=%s", 
-                                      reg_def.address, reg_def.name_en, raw_value, value, reg_def.scale)
+
+                # Map results back to individual registers. The whole batch is
+                # converted to signed words in one C-level pass.
+                words = self._decode_signed_words(result.registers)
+                for reg_def, offset, convert in regs16:
+                    raw_value = words[offset]
+                    # Drop sensor error codes
+                    if raw_value > SENSOR_ERROR_FLOOR:
+                        register_values[reg_def.address] = (reg_def, raw_value, convert)
+
+                for reg_def, high_offset, low_offset, convert in regs32:
+                    high_value = words[high_offset]
+                    low_value = words[low_offset]
+
+                    # Counters are unsigned 32-bit values split into
+                    # conventional high and low Modbus words; combining
+                    # masks the signed halves back to unsigned.
+                    raw_value = combine_u16_words(high_value, low_value)
+
+                    if debug_enabled:
+                        _LOGGER.debug("32-bit %s: high=%d, low=%d, combined raw_value=%d",
+                                      reg_def.name_en, high_value, low_value, raw_value)
+                    register_values[reg_def.address] = (reg_def, raw_value, convert)
+
+            if debug_enabled:
+                _LOGGER.debug("Batch read took %.3fs for %d registers in %d batches",
+                              time.perf_counter() - start_time, register_count, len(batches))
             
+            # Process results; each register carries the converter chosen
+            # for its type and scale when the plan was built.
+            for reg_def, raw_value, convert in register_values.values():
+                value = convert(raw_value)
+                if value is None:
+                    continue
+
+                # Store the entity-facing entry once, keyed by address;
+                # the ModbusReg view below exposes these same dicts.
+                data[reg_def.address] = {
+                    "address": reg_def.address,
+                    "value": value,
+                    "raw": raw_value,
+                    "name": reg_def.name_en,
+                    "unit": reg_def.unit,
+                }
+                
+                # Debug logging for critical sensors
+                if debug_enabled and reg_def.address in DEBUG_LOG_ADDRESSES:
+                    _LOGGER.debug("Register %d (%s): raw=%d, scaled=%s, scale=%s", 
+                                  reg_def.address, reg_def.name_en, raw_value, value, reg_def.scale)
+        
             if not data:
+                if not self.client.connected:
+                    # Socket died mid-poll; reconnect on the next update
+                    self._connected = False
                 _LOGGER.error("No data collected from Modbus - all register reads failed")
                 raise UpdateFailed("No data received from Modbus device")
             
-            # Update feature flags based on data
-            self._update_feature_flags(data)
-            
-            # Format data for entity compatibility: entities expect data["main"]["ModbusReg"]
-            # Convert from {addr: {value, raw, name}} to the expected format
-            modbus_reg_list = []
-            for address, info in data.items():
-                modbus_reg_list.append({
-                    "address": address,
-                    "value": info["value"],
-                    "raw": info["raw"],
-                    "name": info["name"],
-                    "unit": info.get("unit"),
-                })
+            if read_settings:
+                self._settings_read_at = now
+            else:
+                # Settings were not re-read this poll; keep their last values
+                for address in self._settings_addresses:
+                    entry = self._reg_by_addr.get(address)
+                    if entry is not None:
+                        data.setdefault(address, entry)
+            self._polled_at = now
+
+            # Installed equipment only decides which entities are created at
+            # setup, so it is detected once per connection, not every poll
+            if not self._feature_flags_detected:
+                self._update_feature_flags(data)
+                # A failed batch must not latch loops or the reservoir as
+                # missing, so keep re-evaluating until they were all read
+                self._feature_flags_detected = all(
+                    address in data for address in FEATURE_FLAG_ADDRESSES
+                )
             
+            # Format data for entity compatibility: entities expect data["main"]["ModbusReg"].
+            # Consumers only iterate it, so a live view of this poll's dict
+            # stands in for a copied list. Writes update these entries in
+            # place (_optimistic_update_register) until the next poll
+            # replaces the dict.
+            self._reg_by_addr = data
             formatted_data = {
                 "main": {
-                    "ModbusReg": modbus_reg_list
+                    "ModbusReg": data.values()
                 }
             }
             
-            _LOGGER.debug("Successfully read %d registers from Modbus", len(modbus_reg_list))
+            _LOGGER.debug("Successfully read %d registers from Modbus", len(data))
             return formatted_data
             
         except ModbusException as err:
+            if isinstance(err, ConnectionException):
+                self._connected = False
             _LOGGER.error("Modbus communication error: %s", err)
             raise UpdateFailed(f"Modbus error: {err}")
         except Exception as err:
             _LOGGER.error("Unexpected error during Modbus update: %s", err)
             raise UpdateFailed(f"Update failed: {err}")
 
-    def _group_registers_into_batches(self, registers, max_gap=5, max_batch=100):
+    async def _async_load_register_map(self) -> RegisterMap:
+        """Return the parsed register map for the detected register set.
+
+        Reading and parsing both run in the executor. A RegisterMap is never
+        mutated after loading, so the parsed map is kept in hass.data and
+        reused by entry reloads and further entries using the same file.
+        """
+        cache: Dict[str, RegisterMap] = self.hass.data.setdefault(REGISTER_MAP_CACHE, {})
+        cache_key = str(self._json_path)
+        if cache_key not in cache:
+            json_path = self._json_path
+
+            def _load() -> RegisterMap:
+                with open(json_path, "r", encoding="utf-8") as f:
+                    return RegisterMap(json.load(f))
+
+            cache[cache_key] = await self.hass.async_add_executor_job(_load)
+        return cache[cache_key]
+
+    async def _async_ensure_connected(self) -> None:
+        """Reopen the Modbus connection if it dropped since the last poll."""
+        if self.client is None:
+            raise UpdateFailed("Modbus client not initialized")
+        if self._connected and self.client.connected:
+            # pymodbus may have reconnected on its own with a fresh socket
+            self._configure_socket()
+            return
+
+        if self.client.connected:
+            # A connection error left pymodbus holding a half-open socket;
+            # connect() would just reuse it, so drop it first
+            self.client.close()
+
+        for delay in RECONNECT_BACKOFF:
+            try:
+                if await self.client.connect():
+                    self._connected = True
+                    self._configure_socket()
+                    # Re-detect installed equipment after an outage
+                    self._feature_flags_detected = False
+                    _LOGGER.info("Reconnected to Modbus device")
+                    return
+            except (ModbusException, OSError) as err:
+                _LOGGER.debug("Modbus reconnect attempt failed: %s", err)
+            await asyncio.sleep(delay)
+
+        self._connected = False
+        raise UpdateFailed("Modbus client not connected")
+
+    def _configure_socket(self) -> None:
+        """Disable Nagle and enable keepalive on the Modbus TCP socket.
+
+        Each poll is a series of small request/response exchanges, which is
+        the pattern Nagle's algorithm delays. asyncio normally sets
+        TCP_NODELAY itself; set it explicitly so the behavior does not depend
+        on the event loop or pymodbus transport in use. Keepalive probes let
+        the kernel notice gateways that silently drop idle connections.
+
+        Cheap to call every poll: a socket that was already tuned is skipped.
+        """
+        if self.transport == "rtu":
+            return
+        try:
+            sock = self.client.ctx.transport.get_extra_info("socket")
+            if sock is None or sock is self._tuned_socket:
+                return
+            self._tuned_socket = sock
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            for option, value in TCP_KEEPALIVE_OPTIONS:
+                # Not every platform exposes the per-socket keepalive timers
+                if hasattr(socket, option):
+                    sock.setsockopt(socket.IPPROTO_TCP, getattr(socket, option), value)
+        except (AttributeError, OSError) as err:
+            _LOGGER.debug("Could not tune Modbus TCP socket: %s", err)
+
+    async def _read_batch(self, batch_start: int, batch_count: int):
+        """Read one register batch, bounded by the read semaphore."""
+        async with self._read_semaphore:
+            return await self.client.read_holding_registers(
+                documented_to_modbus_address(batch_start),
+                count=batch_count,
+                device_id=self.unit_id,
+            )
+
+    def _build_batch_plan(self, registers=None) -> list[ReadBatch]:
+        """Group the polled registers once and resolve their batch offsets.
+
+        Each batch is a ReadBatch. Its regs16 and regs32 entries carry the
+        word offsets and the value converter from _value_converter, so the
+        decode loop never has to branch on the register type.
+
+        Args:
+            registers: Registers to plan; defaults to every readable
+                register that has not recently failed on its own
+        """
+        if registers is None:
+            registers = [
+                reg_def
+                for reg_def in self.register_map.get_readable()
+                if reg_def.address not in self._failed_registers
+            ]
+        limits = STRICT_BATCH_LIMITS if self._strict_reads else (BATCH_MAX_GAP, BATCH_MAX_SIZE)
+        plan = []
+        for batch_start, batch_count, batch_regs in self._group_registers_into_batches(
+            registers, *limits
+        ):
+            regs16 = tuple(
+                (reg_def, reg_def.address - batch_start, self._value_converter(reg_def))
+                for reg_def in batch_regs
+                if reg_def.type != "Value32"
+            )
+            regs32 = tuple(
+                (
+                    reg_def,
+                    reg_def.register32_high - batch_start,
+                    reg_def.register32_low - batch_start,
+                    self._value_converter(reg_def),
+                )
+                for reg_def in batch_regs
+                if reg_def.type == "Value32"
+            )
+            plan.append(ReadBatch(batch_start, batch_count, regs16, regs32))
+        return plan
+
+    def _rebuild_batch_plans(self) -> None:
+        """Rebuild the full and the volatile read plan from the register map."""
+        registers = [
+            reg_def
+            for reg_def in self.register_map.get_readable()
+            if reg_def.address not in self._failed_registers
+        ]
+        settings = [reg_def for reg_def in registers if "Write" in reg_def.access]
+        self._settings_addresses = frozenset(reg_def.address for reg_def in settings)
+        self._batch_plan = self._build_batch_plan(registers)
+        self._volatile_plan = self._build_batch_plan(
+            [reg_def for reg_def in registers if "Write" not in reg_def.access]
+        )
+
+    async def _async_split_failed_batch(
+        self, batch
+    ) -> tuple[list[tuple[ReadBatch, Any]], list[ReadBatch]]:
+        """Re-read a rejected batch in halves to isolate unsupported registers.
+
+        A register that is rejected on its own is left out of the plan until
+        FAILED_REGISTER_RETRY has passed, so later polls do not pay for it.
+
+        Returns:
+            The (batch, response) pairs for the parts that succeeded, and the
+            sub-batches that should replace the rejected batch in the plan
+        """
+        _start, _count, regs16, regs32 = batch
+        registers = [entry[0] for entry in regs16] + [entry[0] for entry in regs32]
+        if len(registers) == 1:
+            address = registers[0].address
+            _LOGGER.warning(
+                "Register %d (%s) rejected by device; skipping it for %d s",
+                address, registers[0].name_en, FAILED_REGISTER_RETRY,
+            )
+            self._failed_registers[address] = time.monotonic()
+            self._batch_plan = []
+            return [], []
+
+        registers.sort(key=lambda r: self._register_span(r)[0])
+        half = len(registers) // 2
+        responses = []
+        sub_batches = []
+        for part in (registers[:half], registers[half:]):
+            for sub_batch in self._build_batch_plan(part):
+                try:
+                    result = await self._read_batch(sub_batch.start, sub_batch.count)
+                except Exception as err:
+                    # Not a rejection; keep the part and try it again next poll
+                    _LOGGER.debug("Exception reading batch at %d: %s", sub_batch.start, err)
+                    sub_batches.append(sub_batch)
+                    continue
+                if result.isError():
+                    split_responses, split_batches = await self._async_split_failed_batch(sub_batch)
+                    responses.extend(split_responses)
+                    sub_batches.extend(split_batches)
+                else:
+                    responses.append((sub_batch, result))
+                    sub_batches.append(sub_batch)
+        return responses, sub_batches
+
+    @staticmethod
+    def _replace_split_batches(
+        plan: list[ReadBatch], replacements: Dict[int, list[ReadBatch]]
+    ) -> list[ReadBatch]:
+        """Return the plan with rejected batches swapped for their working parts.
+
+        The device can reject an unmapped address inside a coalesced gap, in
+        which case no single register fails. Keeping the parts that read
+        successfully means the batch is split once, not on every poll.
+
+        Args:
+            plan: Read plan the rejected batches came from
+            replacements: Sub-batches keyed by id() of the rejected batch
+        """
+        return [
+            sub_batch
+            for batch in plan
+            for sub_batch in replacements.get(id(batch), (batch,))
+        ]
+
+    def _expire_failed_registers(self) -> None:
+        """Return failed registers to the plan once their retry delay passed."""
+        if not self._failed_registers:
+            return
+        now = time.monotonic()
+        expired = [
+            address
+            for address, failed_at in self._failed_registers.items()
+            if now - failed_at >= FAILED_REGISTER_RETRY
+        ]
+        for address in expired:
+            del self._failed_registers[address]
+        if expired:
+            self._batch_plan = []
+
+    @staticmethod
+    def _value_converter(reg_def):
+        """Pick the function that turns a register's raw value into its state.
+
+        Resolved once per register when the plan is built, so polls do not
+        re-check the type, name and scale of every register.
+        """
+        if reg_def.type in ("Enum", "Bitmask", "Status", "Control"):
+            return _raw_value
+        if reg_def.name_en in PERFORMANCE_FACTOR_NAMES:
+            # Returns None for readings that fit no known encoding
+            return normalize_performance_factor
+        if reg_def.scale and reg_def.scale != 1.0:
+            # Scaled numeric value (Value or Value32)
+            divisor = DECIMAL_SCALE_DIVISORS.get(reg_def.scale)
+            if divisor is not None:
+                return partial(_divided_value, divisor)
+            return partial(_scaled_value, reg_def.scale)
+        return _raw_value
+
+    @staticmethod
+    def _register_span(reg) -> tuple[int, int]:
+        """Return the first and last documented address a register occupies."""
+        if reg.type == "Value32":
+            return (
+                min(reg.register32_high, reg.register32_low),
+                max(reg.register32_high, reg.register32_low),
+            )
+        return reg.address, reg.address
+
+    def _group_registers_into_batches(
+        self, registers, max_gap=BATCH_MAX_GAP, max_batch=BATCH_MAX_SIZE
+    ):
         """Group registers into consecutive batches for efficient Modbus reading.
         
         Args:
@@ -530,66 +929,36 @@ class ModbusCoordinator(ModbusReadMixin, ModbusWriteMixin, DataUpdateCoordinator
         """
         if not registers:
             return []
+        # One FC03 request can never return more than 125 registers
+        max_batch = min(max_batch, MODBUS_MAX_READ_WORDS)
         
         # Sort registers by address (use min of high/low for Value32 types)
-        def get_sort_key(r):
-            if r.type == "Value32":
-                return min(r.register32_high, r.register32_low)
-            return r.address
-        
-        sorted_regs = sorted(registers, key=get_sort_key)
+        sorted_regs = sorted(registers, key=lambda r: self._register_span(r)[0])
         
         batches = []
         current_batch = [sorted_regs[0]]
-        # For Value32, start at the minimum of high/low (should be high)
-        if sorted_regs[0].type == "Value32":
-            batch_start = min(sorted_regs[0].register32_high, sorted_regs[0].register32_low)
-        else:
-            batch_start = sorted_regs[0].address
+        batch_start, batch_end = self._register_span(sorted_regs[0])
         
         for reg in sorted_regs[1:]:
-            if reg.type == "Value32":
-                addr = min(reg.register32_high, reg.register32_low)
-            else:
-                addr = reg.address
-            
-            last_reg = current_batch[-1]
-            if last_reg.type == "Value32":
-                last_addr = max(last_reg.register32_high, last_reg.register32_low)
-            else:
-                last_addr = last_reg.address
+            addr, reg_end = self._register_span(reg)
             
-            # Check if register fits in current batch
-            gap = addr - last_addr
-            batch_span = addr - batch_start + 1
+            # Check if register fits in current batch; the span must cover
+            # both words of a Value32 so its low word is never cut off.
+            gap = addr - batch_end
+            batch_span = max(batch_end, reg_end) - batch_start + 1
             
-            if gap <= max_gap and batch_span <= max_batch and len(current_batch) < max_batch:
+            if gap <= max_gap and batch_span <= max_batch:
                 current_batch.append(reg)
+                batch_end = max(batch_end, reg_end)
             else:
-                # Finalize current batch
-                last_reg = current_batch[-1]
-                if last_reg.type == "Value32":
-                    # For 32-bit, need to include both high and low registers
-                    last_reg_addr = max(last_reg.register32_high, last_reg.register32_low)
-                else:
-                    last_reg_addr = last_reg.address
-                batch_count = last_reg_addr - batch_start + 1
-                batches.append((batch_start, batch_count, current_batch))
+                batches.append((batch_start, batch_end - batch_start + 1, current_batch))
                 
                 # Start new batch
                 current_batch = [reg]
-                batch_start = addr
+                batch_start, batch_end = addr, reg_end
         
         # Add final batch
-        if current_batch:
-            last_reg = current_batch[-1]
-            if last_reg.type == "Value32":
-                # For 32-bit, need to include both high and low registers
-                last_reg_addr = max(last_reg.register32_high, last_reg.register32_low)
-            else:
-                last_reg_addr = last_reg.address
-            batch_count = last_reg_addr - batch_start + 1
-            batches.append((batch_start, batch_count, current_batch))
+        batches.append((batch_start, batch_end - batch_start + 1, current_batch))
         
         return batches
 
@@ -635,7 +1004,7 @@ class ModbusCoordinator(ModbusReadMixin, ModbusWriteMixin, DataUpdateCoordinator
             
             # Check for typical error values (Kronoterm uses specific negative values for errors)
             # -600 (64936 unsigned) is a common "sensor not connected" value
-            if value <= -500:  # Extremely low values indicate sensor errors
+            if value <= SENSOR_ERROR_FLOOR:
                 _LOGGER.debug("Register %d returned error value %d (likely sensor disconnected)", address, value)
                 return None
             
@@ -646,66 +1015,178 @@ class ModbusCoordinator(ModbusReadMixin, ModbusWriteMixin, DataUpdateCoordinator
             return None
 
     async def write_register_by_address(self, address: int, value: int) -> bool:
-        """Write a value to a Modbus register by address (for generic number entities)."""
-        if not self._connected:
+        """Write a value to a Modbus register by address (for generic number entities).
+
+        Writes issued within WRITE_COALESCE_DELAY of each other (one UI
+        action setting mode, setpoint and offsets) are sent together, with
+        adjacent addresses sharing one FC16 request. A register written
+        twice in that window is sent once, with the last value.
+        """
+        if not self._connected and not await self._async_reconnect_for_write():
+            return False
+
+        # A pending batch may still change the register, so only skip
+        # when nothing is queued
+        if self._pending_writes is None and self._is_current_setting(address, value):
+            _LOGGER.debug("Register %d already holds %d; skipping write", address, value)
+            return True
+
+        if self._pending_writes is not None:
+            # Join the batch another write is collecting
+            values, done = self._pending_writes
+            values[address] = value
+            return address not in await asyncio.shield(done)
+
+        values = {address: value}
+        done = self.hass.loop.create_future()
+        self._pending_writes = (values, done)
+        failed = None
+        try:
+            await asyncio.sleep(WRITE_COALESCE_DELAY)
+            self._pending_writes = None
+            failed = await self._async_write_values(values)
+        finally:
+            if self._pending_writes is not None and self._pending_writes[1] is done:
+                self._pending_writes = None
+            if not done.done():
+                # Cancelled or raised: nothing joined here was confirmed,
+                # including writes that joined after this call started
+                done.set_result(set(values) if failed is None else failed)
+        return address not in failed
+
+    def _is_current_setting(self, address: int, value: int) -> bool:
+        """Return True if the latest poll read the register at value.
+
+        Settings are carried over between most polls, so a carried value may
+        predate a change on the controller panel. Only a value re-read by
+        the latest poll, younger than SETTINGS_MAX_AGE, is trusted. A write
+        clears the read, so writes right after a write always go out.
+        """
+        if self._settings_read_at is None or self._settings_read_at != self._polled_at:
+            return False
+        if time.monotonic() - self._settings_read_at >= SETTINGS_MAX_AGE:
+            return False
+        entry = self._reg_by_addr.get(address)
+        return entry is not None and entry["raw"] == value
+
+    async def _async_reconnect_for_write(self) -> bool:
+        """Reopen a dropped connection for a write instead of failing it."""
+        try:
+            await self._async_ensure_connected()
+        except UpdateFailed:
             _LOGGER.error("Cannot write register: Modbus not connected")
             return False
-        
+        return True
+
+    async def _async_write_values(self, values: Dict[int, int]) -> set[int]:
+        """Write address/value pairs and request one refresh afterwards.
+
+        Runs of two or more registers use a single FC16 write; isolated
+        registers use FC6. A run the device rejects as FC16 is retried one
+        register at a time, since FC6 is what these controllers always took.
+
+        Returns:
+            Addresses whose write failed
+        """
+        failed: set[int] = set()
+        async with self._write_lock:
+            for start, run in self._consecutive_runs(values):
+                if len(run) > 1:
+                    if await self._async_send_write(start, run):
+                        continue
+                    _LOGGER.debug(
+                        "Multi-register write at %d rejected; writing registers one by one",
+                        start,
+                    )
+                for address, value in enumerate(run, start):
+                    if not await self._async_send_write(address, [value]):
+                        failed.add(address)
+
+        # Show the written values right away; the (debounced) refresh
+        # below re-reads the settings and reconciles them with the device
+        updated = [
+            self._optimistic_update_register(address, value)
+            for address, value in values.items()
+            if address not in failed
+        ]
+        if any(updated):
+            self.async_update_listeners()
+        self._settings_read_at = None
+        await self.async_request_refresh()
+        return failed
+
+    async def _async_send_write(self, start: int, run: list[int]) -> bool:
+        """Send one FC6 (single register) or FC16 (run) write.
+
+        Failed FC16 writes are logged at debug level only, because the
+        caller retries them register by register.
+
+        Returns:
+            True if the device acknowledged the write
+        """
+        level = logging.ERROR if len(run) == 1 else logging.DEBUG
+        modbus_address = documented_to_modbus_address(start)
+        # Two's complement for negative values
+        words = [value & UINT16_MASK for value in run]
+        _LOGGER.debug("Writing %s to registers %d-%d", run, start, start + len(run) - 1)
         try:
-            # Compensate for addressing mode difference (manual is 1-based, pymodbus is 0-based)
-            modbus_address = documented_to_modbus_address(address)
-            
-            # Convert signed to unsigned 16-bit if negative
-            if value < 0:
-                register_value = value + 65536  # Two's complement
+            if len(words) == 1:
+                result = await self.client.write_register(
+                    modbus_address, value=words[0], device_id=self.unit_id
+                )
             else:
-                register_value = value
-            
-            _LOGGER.info("Writing value %d to register %d → modbus address %d (register value: %d)", 
-                        value, address, modbus_address, register_value)
-            
-            result = await self.client.write_register(
-                modbus_address, value=register_value, device_id=self.unit_id
-            )
-            
-            if result.isError():
-                _LOGGER.error("Error writing register %d: %s", address, result)
-                return False
-            
-            # Request immediate refresh
-            await self.async_request_refresh()
-            
-            return True
-            
+                result = await self.client.write_registers(
+                    modbus_address, values=words, device_id=self.unit_id
+                )
         except Exception as err:
-            _LOGGER.error("Exception writing register %d: %s", address, err)
+            _LOGGER.log(level, "Exception writing registers at %d: %s", start, err)
             return False
+        if result.isError():
+            _LOGGER.log(level, "Error writing registers at %d: %s", start, result)
+            return False
+        return True
+
+    @staticmethod
+    def _consecutive_runs(values: Dict[int, int]) -> list[tuple[int, list[int]]]:
+        """Split address/value pairs into runs of consecutive addresses."""
+        runs: list[tuple[int, list[int]]] = []
+        previous = None
+        for address in sorted(values):
+            if previous is not None and address == previous + 1:
+                runs[-1][1].append(values[address])
+            else:
+                runs.append((address, [values[address]]))
+            previous = address
+        return runs
 
     def _update_feature_flags(self, data: Dict[str, Any]) -> None:
         """Update feature flags based on current data."""
+        # One shared fallback instead of a fresh {} for every missing register
+        missing: Dict[str, Any] = {}
+
         # Check if Loop 2 is installed (has valid temperature reading)
         # Valid range: -50°C to 100°C (after scaling by 0.1)
         # Raw values: -500 to 1000
-        loop2_temp = data.get(2110, {}).get("value")
+        loop2_temp = data.get(2110, missing).get("value")
         self.loop2_installed = loop2_temp is not None and loop2_temp > -500
         
         # Check if Loop 3 is installed (has valid temperature reading)
-        loop3_temp = data.get(2111, {}).get("value")
+        loop3_temp = data.get(2111, missing).get("value")
         self.loop3_installed = loop3_temp is not None and loop3_temp > -500
         
         # Check if Loop 4 is installed (has valid temperature reading)
-        loop4_temp = data.get(2112, {}).get("value")
+        loop4_temp = data.get(2112, missing).get("value")
         self.loop4_installed = loop4_temp is not None and loop4_temp > -500
         
         # Check if Reservoir is installed (has valid setpoint reading)
-        reservoir_setpoint = data.get(2034, {}).get("value")
+        reservoir_setpoint = data.get(2034, missing).get("value")
         self.reservoir_installed = reservoir_setpoint is not None and reservoir_setpoint > 0
 
         # Check if Pool is installed (has valid setpoint/temperature reading)
-        pool_setpoint = data.get(2080, {}).get("value")
-        pool_temp = data.get(2109, {}).get("value")
-        pool_enable = data.get(2020, {}).get("value")
-        pool_operation_mode = data.get(2081, {}).get("value")
+        pool_setpoint = data.get(2080, missing).get("value")
+        pool_temp = data.get(2109, missing).get("value")
+        pool_enable = data.get(2020, missing).get("value")
+        pool_operation_mode = data.get(2081, missing).get("value")
         self.pool_installed = (
             is_pool_setpoint_available(pool_setpoint)
             or is_pool_temperature_available(pool_temp)
@@ -719,7 +1200,7 @@ class ModbusCoordinator(ModbusReadMixin, ModbusWriteMixin, DataUpdateCoordinator
                        loop2_temp, loop3_temp, loop4_temp, reservoir_setpoint)
         
         # Check if additional source is installed
-        add_source = data.get(2002, {}).get("raw", 0)
+        add_source = data.get(2002, missing).get("raw", 0)
         self.additional_source_installed = bool(add_source)
 
     @staticmethod
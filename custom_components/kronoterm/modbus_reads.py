@@ -20,6 +20,7 @@ class ModbusReadMixin:
     - self.client (AsyncModbusTcpClient)
     - self.unit_id (int)
     - self._connected (bool)
+    - self._reg_by_addr (dict of address -> ModbusReg entry, refreshed each poll)
     """
 
     def _group_registers_into_batches(
@@ -141,50 +142,6 @@ class ModbusReadMixin:
             _LOGGER.debug("Exception reading register %d: %s", address, err)
             return None
 
-    async def write_register_by_address(self, address: int, value: int) -> bool:
-        """Write a value to a Modbus register by address.
-        
-        Note: Kronoterm manual uses 1-based addressing, but pymodbus uses 0-based.
-        We subtract 1 from the address to compensate (same as reads).
-        
-        Args:
-            address: Modbus register address (1-based)
-            value: Value to write
-            
-        Returns:
-            True if successful, False otherwise
-        """
-        if not self._connected:
-            _LOGGER.error("Cannot write register: Modbus not connected")
-            return False
-        
-        try:
-            # Compensate for addressing mode difference (manual is 1-based, pymodbus is 0-based)
-            modbus_address = documented_to_modbus_address(address)
-            
-            _LOGGER.info("Writing value %d to register %d (modbus address %d)", 
-                        value, address, modbus_address)
-            
-            result = await self.client.write_register(
-                modbus_address, value=value, device_id=self.unit_id
-            )
-            
-            if result.isError():
-                _LOGGER.error("Error writing to register %d: %s", address, result)
-                return False
-            
-            _LOGGER.info("Successfully wrote value %d to register %d", value, address)
-            
-            # Optimistically update coordinator data for instant UI feedback
-            if hasattr(self, '_optimistic_update_register'):
-                self._optimistic_update_register(address, value)
-            
-            return True
-            
-        except Exception as err:
-            _LOGGER.error("Exception writing to register %d: %s", address, err)
-            return False
-
     def get_register_value(self, address: int) -> Optional[Any]:
         """Get current value of a register from cached data by address.
         
@@ -194,13 +151,5 @@ class ModbusReadMixin:
         Returns:
             Register value from cache, or None if not found
         """
-        if not self.data:
-            return None
-        
-        # Data is now in format: {"main": {"ModbusReg": [...]}}
-        modbus_reg_list = self.data.get("main", {}).get("ModbusReg", [])
-        for reg in modbus_reg_list:
-            if reg.get("address") == address:
-                return reg.get("value")
-        
-        return None
+        entry = self._reg_by_addr.get(address)
+        return entry["value"] if entry is not None else None
@@ -10,6 +10,40 @@ from typing import Optional
 
 _LOGGER = logging.getLogger(__name__)
 
+# Cloud API page -> temperature setpoint register
+PAGE_SETPOINT_REGISTERS = {
+    5: 2187,  # Loop 1 setpoint
+    6: 2049,  # Loop 2 setpoint
+    9: 2023,  # DHW setpoint
+    10: 2079, # Pool setpoint
+}
+
+# (Cloud API page, param_name) -> eco/comfort offset register
+PAGE_OFFSET_REGISTERS = {
+    (5, "circle_eco_offset"): 2047,      # Loop 1 eco
+    (5, "circle_comfort_offset"): 2048,  # Loop 1 comfort
+    (6, "circle_eco_offset"): 2057,      # Loop 2 eco
+    (6, "circle_comfort_offset"): 2058,  # Loop 2 comfort
+    (7, "circle_eco_offset"): 2067,      # Loop 3 eco
+    (7, "circle_comfort_offset"): 2068,  # Loop 3 comfort
+    (8, "circle_eco_offset"): 2077,      # Loop 4 eco
+    (8, "circle_comfort_offset"): 2078,  # Loop 4 comfort
+    (9, "circle_eco_offset"): 2030,      # DHW eco
+    (9, "circle_comfort_offset"): 2031,  # DHW comfort
+    (10, "circle_eco_offset"): 2086,     # Pool eco
+    (10, "circle_comfort_offset"): 2087, # Pool comfort
+}
+
+# Cloud API page -> loop operation mode register
+PAGE_MODE_REGISTERS = {
+    5: 2042,  # Loop 1
+    6: 2052,  # Loop 2
+    7: 2062,  # Loop 3
+    8: 2072,  # Loop 4
+    9: 2026,  # DHW operation
+    10: 2081, # Pool operation mode
+}
+
 
 class ModbusWriteMixin:
     """Mixin class for Modbus write operations.
@@ -20,37 +54,61 @@ class ModbusWriteMixin:
     - self.unit_id (int)
     - self._connected (bool)
     - self.write_register_by_address(address, value) method
-    - self.data (dict) - coordinator data
-    - self.async_set_updated_data(data) method
+    - self._reg_by_addr (dict of address -> ModbusReg entry, refreshed each poll)
+    - self._value_converter(reg_def) returning the raw -> state converter
     """
 
-    def _optimistic_update_register(self, address: int, value: int) -> None:
-        """Optimistically update coordinator data after a successful write.
-        
-        This updates the UI immediately without waiting for the next poll.
-        
+    def _optimistic_update_register(self, address: int, value: int) -> bool:
+        """Apply a successfully written value to the latest poll's data.
+
+        Entities see the new state without waiting for the refresh that
+        follows the write; that refresh still reconciles the device state.
+
         Args:
             address: Register address that was written
-            value: New value that was written
+            value: Signed raw value that was written
+
+        Returns:
+            True if a polled entry was updated
         """
-        if not self.data or "main" not in self.data:
-            return
-        
-        modbus_reg_list = self.data.get("main", {}).get("ModbusReg", [])
-        for reg in modbus_reg_list:
-            if reg.get("address") == address:
-                # Update BOTH value and raw (switches read from raw!)
-                old_value = reg.get("value")
-                old_raw = reg.get("raw")
-                reg["value"] = value
-                reg["raw"] = value  # Switches read from raw!
-                _LOGGER.debug(
-                    "Optimistically updated register %d: value %s -> %s, raw %s -> %s",
-                    address, old_value, value, old_raw, value
-                )
-                # Trigger coordinator update event to refresh entity states
-                self.async_set_updated_data(self.data)
-                return
+        entry = self._reg_by_addr.get(address)
+        reg_def = self.register_map.get(address) if self.register_map else None
+        if entry is None or reg_def is None:
+            return False
+        new_value = self._value_converter(reg_def)(value)
+        if new_value is None:
+            return False
+        _LOGGER.debug(
+            "Optimistically updated register %d: value %s -> %s, raw %s -> %s",
+            address, entry["value"], new_value, entry["raw"], value
+        )
+        # Switches read raw, the other platforms read value
+        entry["raw"] = value
+        entry["value"] = new_value
+        return True
+
+    async def _async_write_switch(
+        self, name_en: str, address: int, label: str, enable: bool
+    ) -> bool:
+        """Write 1/0 to an on/off control register.
+
+        Args:
+            name_en: Register name in the register map
+            address: Documented address used if the name is not mapped
+            label: Human-readable name for the log
+            enable: True to switch on, False to switch off
+
+        Returns:
+            True if successful, False otherwise
+        """
+        value = 1 if enable else 0
+        _LOGGER.debug("Setting %s to %s (value: %d)", label, "ON" if enable else "OFF", value)
+
+        reg = self.register_map.resolve(name_en, address)
+        if not reg:
+            _LOGGER.error("Register %d (%s) not found in register map", address, name_en)
+            return False
+        return await self.write_register_by_address(reg.address, value)
 
     async def async_write_register(self, address: int, temperature: float) -> bool:
         """Write a temperature value to a Modbus register.
@@ -65,9 +123,9 @@ class ModbusWriteMixin:
             True if successful, False otherwise
         """
         # Convert temperature to Modbus format (× 10)
-        modbus_value = int(round(temperature * 10))
+        modbus_value = round(temperature * 10)
         
-        _LOGGER.info("Writing temperature %.1f°C (modbus: %d) to register %d",
+        _LOGGER.debug("Writing temperature %.1f°C (modbus: %d) to register %d",
                     temperature, modbus_value, address)
         
         return await self.write_register_by_address(address, modbus_value)
@@ -82,7 +140,7 @@ class ModbusWriteMixin:
         Returns:
             True if successful, False otherwise
         """
-        _LOGGER.info("Writing raw value %d to register %d", value, address)
+        _LOGGER.debug("Writing raw value %d to register %d", value, address)
         return await self.write_register_by_address(address, int(value))
 
     async def async_set_temperature(self, page: int, new_temp: float) -> bool:
@@ -96,22 +154,15 @@ class ModbusWriteMixin:
             True if successful, False otherwise
         """
         # Map Cloud API "page" to Modbus registers
-        page_to_register = {
-            5: 2187,  # Loop 1 setpoint
-            6: 2049,  # Loop 2 setpoint
-            9: 2023,  # DHW setpoint
-            10: 2079, # Pool setpoint
-        }
-        
-        register_address = page_to_register.get(page)
-        if not register_address:
+        register_address = PAGE_SETPOINT_REGISTERS.get(page)
+        if register_address is None:
             _LOGGER.error("Unknown page %d for temperature setpoint", page)
             return False
         
         # Convert temperature to Modbus format (× 10)
-        modbus_value = int(round(new_temp * 10))
+        modbus_value = round(new_temp * 10)
         
-        _LOGGER.info("Setting temperature for page %d to %.1f°C (modbus value: %d)", 
+        _LOGGER.debug("Setting temperature for page %d to %.1f°C (modbus value: %d)", 
                     page, new_temp, modbus_value)
         
         # Write directly using register_by_address (no need for Register object)
@@ -129,31 +180,15 @@ class ModbusWriteMixin:
             True if successful, False otherwise
         """
         # Map page + param_name to Modbus register
-        offset_map = {
-            # (page, param_name): register_address
-            (5, "circle_eco_offset"): 2047,      # Loop 1 eco
-            (5, "circle_comfort_offset"): 2048,  # Loop 1 comfort
-            (6, "circle_eco_offset"): 2057,      # Loop 2 eco
-            (6, "circle_comfort_offset"): 2058,  # Loop 2 comfort
-            (7, "circle_eco_offset"): 2067,      # Loop 3 eco
-            (7, "circle_comfort_offset"): 2068,  # Loop 3 comfort
-            (8, "circle_eco_offset"): 2077,      # Loop 4 eco
-            (8, "circle_comfort_offset"): 2078,  # Loop 4 comfort
-            (9, "circle_eco_offset"): 2030,      # DHW eco
-            (9, "circle_comfort_offset"): 2031,  # DHW comfort
-            (10, "circle_eco_offset"): 2086,     # Pool eco
-            (10, "circle_comfort_offset"): 2087, # Pool comfort
-        }
-        
-        register_address = offset_map.get((page, param_name))
-        if not register_address:
+        register_address = PAGE_OFFSET_REGISTERS.get((page, param_name))
+        if register_address is None:
             _LOGGER.error("Unknown offset: page=%d, param=%s", page, param_name)
             return False
         
         # Convert offset to Modbus format (× 10)
-        modbus_value = int(round(new_value * 10))
+        modbus_value = round(new_value * 10)
         
-        _LOGGER.info("Setting offset for page %d/%s to %.1f°C (modbus value: %d)",
+        _LOGGER.debug("Setting offset for page %d/%s to %.1f°C (modbus value: %d)",
                     page, param_name, new_value, modbus_value)
         
         # Write directly using register_by_address (no need for Register object)
@@ -168,15 +203,7 @@ class ModbusWriteMixin:
         Returns:
             True if successful, False otherwise
         """
-        value = 1 if turn_on else 0
-        _LOGGER.info("Setting heat pump state to %s (value: %d)", "ON" if turn_on else "OFF", value)
-        
-        # Use register_map for JSON-based lookup (address 2012)
-        reg = self.register_map.get_by_name("system_on") or self.register_map.get(2012)
-        if not reg:
-            _LOGGER.error("Register 2012 (system_on) not found in register map")
-            return False
-        return await self.write_register_by_address(reg.address, value)
+        return await self._async_write_switch("system_on", 2012, "heat pump state", turn_on)
 
     async def async_set_loop_mode_by_page(self, page: int, new_mode: int) -> bool:
         """Set loop operation mode (off/normal/eco/comfort) based on page.
@@ -189,21 +216,12 @@ class ModbusWriteMixin:
             True if successful, False otherwise
         """
         # Map page to loop mode register
-        page_to_register = {
-            5: 2042,  # Loop 1
-            6: 2052,  # Loop 2
-            7: 2062,  # Loop 3
-            8: 2072,  # Loop 4
-            9: 2026,  # DHW operation
-            10: 2081, # Pool operation mode
-        }
-        
-        register_address = page_to_register.get(page)
-        if not register_address:
+        register_address = PAGE_MODE_REGISTERS.get(page)
+        if register_address is None:
             _LOGGER.error("Unknown page %d for loop mode", page)
             return False
         
-        _LOGGER.info("Setting loop mode for page %d to %d", page, new_mode)
+        _LOGGER.debug("Setting loop mode for page %d to %d", page, new_mode)
         
         # Write directly using register_by_address (no need for Register object)
         return await self.write_register_by_address(register_address, new_mode)
@@ -221,12 +239,12 @@ class ModbusWriteMixin:
         """
         # IMPORTANT: This register uses scale=1, not 0.1!
         # Value is in whole degrees Celsius
-        modbus_value = int(round(new_value))
+        modbus_value = round(new_value)
         
-        _LOGGER.info("Setting main temperature correction to %d°C", modbus_value)
+        _LOGGER.debug("Setting main temperature correction to %d°C", modbus_value)
         
         # Use register_map for JSON-based lookup (address 2014)
-        reg = self.register_map.get_by_name("system_temperature_correction") or self.register_map.get(2014)
+        reg = self.register_map.resolve("system_temperature_correction", 2014)
         if not reg:
             _LOGGER.error("Register 2014 (system_temperature_correction) not found in register map")
             return False
@@ -241,15 +259,7 @@ class ModbusWriteMixin:
         Returns:
             True if successful, False otherwise
         """
-        value = 1 if enable else 0
-        _LOGGER.info("Setting anti-legionella to %s (value: %d)", "ON" if enable else "OFF", value)
-        
-        # Use register_map for JSON-based lookup (address 2301)
-        reg = self.register_map.get_by_name("thermal_disinfection") or self.register_map.get(2301)
-        if not reg:
-            _LOGGER.error("Register 2301 (thermal_disinfection) not found in register map")
-            return False
-        return await self.write_register_by_address(reg.address, value)
+        return await self._async_write_switch("thermal_disinfection", 2301, "anti-legionella", enable)
 
     async def async_set_dhw_circulation(self, enable: bool) -> bool:
         """Enable/disable DHW circulation pump.
@@ -260,15 +270,7 @@ class ModbusWriteMixin:
         Returns:
             True if successful, False otherwise
         """
-        value = 1 if enable else 0
-        _LOGGER.info("Setting DHW circulation to %s (value: %d)", "ON" if enable else "OFF", value)
-        
-        # Use register 2328 (dhw_circulation_pump)
-        reg = self.register_map.get_by_name("dhw_circulation_pump") or self.register_map.get(2328)
-        if not reg:
-            _LOGGER.error("Register 2328 (dhw_circulation_pump) not found in register map")
-            return False
-        return await self.write_register_by_address(reg.address, value)
+        return await self._async_write_switch("dhw_circulation_pump", 2328, "DHW circulation", enable)
 
     async def async_set_fast_water_heating(self, enable: bool) -> bool:
         """Enable/disable fast DHW heating.
@@ -279,15 +281,7 @@ class ModbusWriteMixin:
         Returns:
             True if successful, False otherwise
         """
-        value = 1 if enable else 0
-        _LOGGER.info("Setting fast water heating to %s (value: %d)", "ON" if enable else "OFF", value)
-        
-        # Use register_map for JSON-based lookup (address 2015)
-        reg = self.register_map.get_by_name("dhw_quick_heating_enable") or self.register_map.get(2015)
-        if not reg:
-            _LOGGER.error("Register 2015 (dhw_quick_heating_enable) not found in register map")
-            return False
-        return await self.write_register_by_address(reg.address, value)
+        return await self._async_write_switch("dhw_quick_heating_enable", 2015, "fast water heating", enable)
 
     async def async_set_reserve_source(self, enable: bool) -> bool:
         """Enable/disable reserve heating source.
@@ -298,15 +292,7 @@ class ModbusWriteMixin:
         Returns:
             True if successful, False otherwise
         """
-        value = 1 if enable else 0
-        _LOGGER.info("Setting reserve source to %s (value: %d)", "ON" if enable else "OFF", value)
-        
-        # Use register_map for JSON-based lookup (address 2018)
-        reg = self.register_map.get_by_name("reserve_source_enable") or self.register_map.get(2018)
-        if not reg:
-            _LOGGER.error("Register 2018 (reserve_source_enable) not found in register map")
-            return False
-        return await self.write_register_by_address(reg.address, value)
+        return await self._async_write_switch("reserve_source_enable", 2018, "reserve source", enable)
 
     async def async_set_additional_source(self, enable: bool) -> bool:
         """Enable/disable additional heating source.
@@ -317,15 +303,7 @@ class ModbusWriteMixin:
         Returns:
             True if successful, False otherwise
         """
-        value = 1 if enable else 0
-        _LOGGER.info("Setting additional source to %s (value: %d)", "ON" if enable else "OFF", value)
-        
-        # Use register_map for JSON-based lookup (address 2016)
-        reg = self.register_map.get_by_name("additional_source_enable") or self.register_map.get(2016)
-        if not reg:
-            _LOGGER.error("Register 2016 (additional_source_enable) not found in register map")
-            return False
-        return await self.write_register_by_address(reg.address, value)
+        return await self._async_write_switch("additional_source_enable", 2016, "additional source", enable)
 
     async def async_set_main_mode(self, new_mode: int) -> bool:
         """Set main operational mode (auto/comfort/eco).
@@ -336,10 +314,10 @@ class ModbusWriteMixin:
         Returns:
             True if successful, False otherwise
         """
-        _LOGGER.info("Setting program selection to %d", new_mode)
+        _LOGGER.debug("Setting program selection to %d", new_mode)
         
         # Use register_map for JSON-based lookup (address 2013)
-        reg = self.register_map.get_by_name("operation_program_select") or self.register_map.get(2013)
+        reg = self.register_map.resolve("operation_program_select", 2013)
         if not reg:
             _LOGGER.error("Register 2013 (operation_program_select) not found in register map")
             return False
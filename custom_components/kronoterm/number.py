@@ -2,6 +2,7 @@
 
 import logging
 import re
+import sys
 from dataclasses import dataclass
 from typing import Any, List, Optional
 
@@ -291,7 +292,7 @@ class KronotermModbusNumber(KronotermModbusBase, NumberEntity):
         self._attr_native_unit_of_measurement = unit
         self._attr_icon = icon
         self._attr_mode = NumberMode.BOX
-        self._unique_id = f"{coordinator.config_entry.entry_id}_{DOMAIN}_modbus_number_{address}"
+        self._unique_id = sys.intern(f"{coordinator.config_entry.entry_id}_{DOMAIN}_modbus_number_{address}")
     
     @property
     def unique_id(self) -> str:
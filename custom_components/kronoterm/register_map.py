@@ -12,9 +12,13 @@ from typing import Dict, List, Optional, Any
 _LOGGER = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RegisterDefinition:
-    """A single Modbus register definition."""
+    """A single Modbus register definition.
+
+    Definitions are read-only once the map is loaded; slots keep the few
+    hundred instances small and their attribute reads direct.
+    """
     address: int
     name: str  # Original Slovenian name
     name_en: str  # Auto-translated English name (snake_case)
@@ -44,6 +48,15 @@ class RegisterMap:
         self._registers: Dict[int, RegisterDefinition] = {}
         self._meta_info: Dict[str, Any] = {}
         self._load_from_dict(data)
+        # The map is immutable once loaded, so the polled set is fixed too
+        self._readable: tuple[RegisterDefinition, ...] = tuple(
+            self.get_sensors() + self.get_controls()
+        )
+        # name_en -> register; the first register with a name wins, as in
+        # the original scan, so the write setters resolve in O(1)
+        self._by_name: Dict[str, RegisterDefinition] = {}
+        for reg in self._registers.values():
+            self._by_name.setdefault(reg.name_en, reg)
 
     def _load_from_dict(self, data: dict) -> None:
         """Parse the JSON data."""
@@ -95,6 +108,14 @@ class RegisterMap:
                     register32_low=reg_data.get("register32_low"),
                     disabled=reg_data.get("disabled", False),
                 )
+                if address in self._registers:
+                    # Each address is polled once; a second entry would
+                    # silently replace the first one's entities
+                    _LOGGER.warning(
+                        "Duplicate register address %d (%s); keeping the later definition",
+                        address,
+                        name_en,
+                    )
                 self._registers[address] = reg_def
                 
             _LOGGER.info("Loaded %d register definitions", len(self._registers))
@@ -435,15 +456,31 @@ class RegisterMap:
             reg = register_map.get_by_name("system_on")
             # Returns register 2012 (Vklop sistema)
         """
-        for reg in self._registers.values():
-            if reg.name_en == name_en:
-                return reg
-        return None
+        return self._by_name.get(name_en)
+
+    def resolve(self, name_en: str, address: int) -> Optional[RegisterDefinition]:
+        """Get register definition by English name, falling back to address.
+
+        Args:
+            name_en: English name (snake_case) from name_en field
+            address: Documented address used when the name is not mapped
+
+        Returns:
+            RegisterDefinition if found, None otherwise
+        """
+        return self._by_name.get(name_en) or self._registers.get(address)
 
     def get_all(self) -> List[RegisterDefinition]:
         """Get all register definitions."""
         return list(self._registers.values())
 
+    def get_readable(self) -> tuple[RegisterDefinition, ...]:
+        """Get every register the coordinator polls (sensors and controls).
+
+        Returns the same tuple on every call; it is built once at load time.
+        """
+        return self._readable
+
     def get_sensors(self) -> List[RegisterDefinition]:
         """Get all readable registers suitable for sensors (includes Bitmask for binary sensors)."""
         return [
@@ -1,6 +1,7 @@
 import logging
 import re
-from typing import Any, Dict, List, Optional
+import sys
+from typing import Any, Dict, List, NamedTuple, Optional
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
@@ -43,6 +44,14 @@ except ImportError:
 _LOGGER = logging.getLogger(__name__)
 
 
+class _SensorMeta(NamedTuple):
+    """Display settings shared by register sensors configured alike."""
+
+    unit: Optional[str]
+    scale: float
+    icon: Optional[str]
+
+
 class KronotermDiagnosticSensor(CoordinatorEntity, SensorEntity):
     """Expose opt-in, non-sensitive connection diagnostics."""
 
@@ -135,6 +144,11 @@ class KronotermModbusRegSensor(KronotermModbusBase, SensorEntity):
         2191: 2042,  # loop_1_room_current_setpoint → loop_1_operation_mode
     }
 
+    # Most registers share a handful of (unit, scale, icon) combinations, so
+    # entities reference one interned tuple per combination instead of
+    # holding three attributes each.
+    _META_CACHE: Dict[_SensorMeta, _SensorMeta] = {}
+
     def __init__(
         self,
         coordinator: DataUpdateCoordinator,
@@ -148,13 +162,12 @@ class KronotermModbusRegSensor(KronotermModbusBase, SensorEntity):
         precision: int = 2,
     ) -> None:
         super().__init__(coordinator, address, name, device_info)
-        self._scale = scale
-        self._unit = unit
-        self._icon = icon
+        meta = _SensorMeta(unit, scale, icon)
+        self._meta = self._META_CACHE.setdefault(meta, meta)
         self._register32_low = register32_low
         self._precision = precision
         # Use name-based unique_id to match Cloud API format (prevents duplicates on reconfigure)
-        self._unique_id = f"{coordinator.config_entry.entry_id}_{DOMAIN}_{name}"
+        self._unique_id = sys.intern(f"{coordinator.config_entry.entry_id}_{DOMAIN}_{name}")
 
     @property
     def unique_id(self) -> str:
@@ -162,24 +175,42 @@ class KronotermModbusRegSensor(KronotermModbusBase, SensorEntity):
 
     @property
     def icon(self) -> Optional[str]:
-        return self._icon
+        return self._meta.icon
 
     @property
     def native_unit_of_measurement(self) -> Optional[str]:
-        return self._unit
+        return self._meta.unit
 
     def _process_value(self, raw_value: Any) -> Optional[float]:
         if isinstance(raw_value, str):
-            raw_value = re.sub(r"[^\d\.\-]", "", raw_value)
-        if raw_value == "":
+            return self._process_string_value(raw_value)
+        if not isinstance(raw_value, (int, float)):
             return None
         if self._name_key in PERFORMANCE_FACTOR_NAMES:
             return normalize_performance_factor(raw_value)
         val = float(raw_value)
-        if self._scale != 1:
-            val *= self._scale
+        scale = self._meta.scale
+        if scale != 1:
+            val *= scale
         return round(val, self._precision)
 
+    def _process_string_value(self, raw_value: str) -> Optional[float]:
+        """Parse a Cloud string value such as "21.5 °C" before scaling."""
+        raw_value = re.sub(r"[^\d\.\-]", "", raw_value)
+        if raw_value == "":
+            return None
+        try:
+            number = float(raw_value)
+        except ValueError:
+            _LOGGER.debug(
+                "Error processing value for address %s (%s): %r",
+                self._address,
+                self._name_key,
+                raw_value,
+            )
+            return None
+        return self._process_value(number)
+
     def _get_modbus_value_for(self, address: int) -> Optional[float]:
         for reg in self.modbus_data:
             if reg.get("address") == address:
@@ -252,7 +283,7 @@ class KronotermModbusRegSensor(KronotermModbusBase, SensorEntity):
         value = self._compute_value()
         if (
             value is not None
-            and self._unit == "°C"
+            and self._meta.unit == "°C"
             and not is_measured_temperature_plausible(value)
         ):
             _LOGGER.debug(
@@ -281,7 +312,7 @@ class KronotermEnumSensor(KronotermModbusBase, SensorEntity):
         self._options = options
         self._icon = icon
         # Include config entry ID to prevent conflicts with Cloud API integration
-        self._unique_id = f"{coordinator.config_entry.entry_id}_{DOMAIN}_enum_{address}"
+        self._unique_id = sys.intern(f"{coordinator.config_entry.entry_id}_{DOMAIN}_enum_{address}")
         self._attr_device_class = SensorDeviceClass.ENUM
         self._attr_options = list(self._options.values())
 
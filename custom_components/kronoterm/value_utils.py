@@ -1,6 +1,9 @@
 """Helpers for decoding Kronoterm register values."""
 
+import struct
+
 UINT16_MASK = 0xFFFF
+MODBUS_MAX_READ_WORDS = 125
 MEASURED_TEMPERATURE_MIN = -60.0
 MEASURED_TEMPERATURE_MAX = 150.0
 PERFORMANCE_FACTOR_NAMES = {"cop_value", "scop_value"}
@@ -100,3 +103,26 @@ class KronotermTcpPacketNormalizer:
         if self._request_transaction_id is None:
             return data
         return self._request_transaction_id + data[2:]
+
+
+class SignedWordDecoder:
+    """Reinterpret a block of unsigned Modbus words as signed 16-bit values.
+
+    Packs into one preallocated bytearray with precompiled structs, so
+    decoding a batch is two C-level calls and allocates only the result.
+    """
+
+    def __init__(self, max_words: int = MODBUS_MAX_READ_WORDS) -> None:
+        self._buffer = bytearray(2 * max_words)
+        self._structs: dict[int, tuple[struct.Struct, struct.Struct]] = {}
+
+    def __call__(self, words) -> tuple[int, ...]:
+        count = len(words)
+        structs = self._structs.get(count)
+        if structs is None:
+            structs = (struct.Struct(f"<{count}H"), struct.Struct(f"<{count}h"))
+            self._structs[count] = structs
+            if len(self._buffer) < 2 * count:
+                self._buffer = bytearray(2 * count)
+        structs[0].pack_into(self._buffer, 0, *words)
+        return structs[1].unpack_from(self._buffer)
@@ -223,6 +223,16 @@ class ModbusAddressTests(unittest.TestCase):
         with self.assertRaises(ValueError):
             value_utils.documented_to_modbus_address(0)
 
+    def test_batch_words_are_reinterpreted_as_signed(self) -> None:
+        value_utils = load_component_module("value_utils")
+
+        decoder = value_utils.SignedWordDecoder(max_words=2)
+        self.assertEqual(decoder([65535, 1]), (-1, 1))
+        words = decoder([0, 215, 32767, 32768, 65535])
+        self.assertEqual(words, (0, 215, 32767, -32768, -1))
+        self.assertEqual(decoder([40000]), (-25536,))
+        self.assertEqual(value_utils.combine_u16_words(words[4], words[1]), 0xFFFF00D7)
+
     def test_config_validation_uses_runtime_framing_helpers(self) -> None:
         source = (COMPONENT / "config_flow_modbus.py").read_text(encoding="utf-8")
 
@@ -0,0 +1,630 @@
+"""Offline checks for how the Modbus coordinator groups register reads."""
+
+from __future__ import annotations
+
+import ast
+import asyncio
+from functools import partial
+import importlib.util
+import json
+import logging
+from pathlib import Path
+import textwrap
+import time
+from types import SimpleNamespace
+from typing import NamedTuple
+import unittest
+
+
+ROOT = Path(__file__).resolve().parents[1]
+COMPONENT = ROOT / "custom_components" / "kronoterm"
+
+
+def source(name: str) -> str:
+    return (COMPONENT / name).read_text(encoding="utf-8")
+
+
+def module_constants(filename: str) -> dict[str, object]:
+    """Return the literal module-level constants of a component file."""
+    constants: dict[str, object] = {}
+    for node in ast.parse(source(filename)).body:
+        if isinstance(node, ast.Assign) and len(node.targets) == 1:
+            target = node.targets[0]
+            if isinstance(target, ast.Name) and target.id.isupper():
+                try:
+                    constants[target.id] = ast.literal_eval(node.value)
+                except ValueError:
+                    continue
+    return constants
+
+
+def load_value_utils():
+    spec = importlib.util.spec_from_file_location(
+        "kronoterm_value_utils", COMPONENT / "value_utils.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader is not None
+    spec.loader.exec_module(module)
+    return module
+
+
+def coordinator_subject(*method_names: str):
+    """Build a bare class carrying the named ModbusCoordinator methods.
+
+    Module-level helper functions and classes and the value_utils helpers the
+    coordinator imports are available to the methods, as in the module.
+    """
+    text = source("modbus_coordinator.py")
+    tree = ast.parse(text)
+    value_utils = load_value_utils()
+    namespace: dict[str, object] = {
+        "asyncio": asyncio,
+        "partial": partial,
+        "NamedTuple": NamedTuple,
+        "logging": logging,
+        "_LOGGER": logging.getLogger("kronoterm_test"),
+        "time": time,
+    }
+    namespace.update(
+        (name, getattr(value_utils, name))
+        for name in dir(value_utils)
+        if not name.startswith("__")
+    )
+    namespace.update(module_constants("modbus_coordinator.py"))
+    methods = {}
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef) or (
+            isinstance(node, ast.ClassDef) and node.name != "ModbusCoordinator"
+        ):
+            exec(ast.get_source_segment(text, node), namespace)  # noqa: S102
+        if isinstance(node, ast.ClassDef) and node.name == "ModbusCoordinator":
+            for child in node.body:
+                if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    methods[child.name] = child
+    class_source = "class Subject:\n"
+    for name in method_names:
+        node = methods[name]
+        segment = ast.get_source_segment(text, node) or ""
+        decorators = "".join(
+            f"@{ast.get_source_segment(text, decorator)}\n"
+            for decorator in node.decorator_list
+        )
+        class_source += textwrap.indent(decorators + segment, "    ") + "\n"
+    exec(class_source, namespace)  # noqa: S102 - trusted repository source
+    return namespace["Subject"]()
+
+
+def register(
+    address: int,
+    reg_type: str = "Value",
+    high=None,
+    low=None,
+    name_en: str = "",
+    scale: float = 1.0,
+    access: str = "Read",
+):
+    return SimpleNamespace(
+        address=address,
+        unit=None,
+        type=reg_type,
+        access=access,
+        register32_high=high,
+        register32_low=low,
+        name_en=name_en,
+        scale=scale,
+    )
+
+
+class ModbusBatchingTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.subject = coordinator_subject(
+            "_build_batch_plan",
+            "_rebuild_batch_plans",
+            "_value_converter",
+            "_register_span",
+            "_group_registers_into_batches",
+        )
+        self.subject._strict_reads = False
+
+    def test_small_gaps_are_coalesced_into_one_request(self) -> None:
+        batches = self.subject._group_registers_into_batches(
+            [register(2000), register(2012), register(2030)]
+        )
+        self.assertEqual([(start, count) for start, count, _ in batches], [(2000, 31)])
+
+    def test_batches_stay_below_the_fc03_register_limit(self) -> None:
+        regs = [register(2000 + step * 10) for step in range(40)]
+        batches = self.subject._group_registers_into_batches(regs)
+        self.assertGreater(len(batches), 1)
+        self.assertTrue(all(count <= 125 for _, count, _ in batches))
+        self.assertEqual(sum(len(members) for _, _, members in batches), len(regs))
+
+    def test_requested_batch_size_is_capped_at_the_spec_limit(self) -> None:
+        regs = [register(2000 + step) for step in range(300)]
+        batches = self.subject._group_registers_into_batches(regs, max_batch=500)
+        self.assertEqual([count for _, count, _ in batches], [125, 125, 50])
+
+    def test_value32_span_counts_both_words(self) -> None:
+        regs = [register(2000), register(2019, "Value32", high=2019, low=2020)]
+        batches = self.subject._group_registers_into_batches(regs, max_batch=20)
+        self.assertEqual([(start, count) for start, count, _ in batches], [(2000, 1), (2019, 2)])
+
+    def test_batch_plan_resolves_word_offsets(self) -> None:
+        counter = register(2110, "Value32", high=2110, low=2111)
+        temperature = register(2101)
+        self.subject.register_map = SimpleNamespace(
+            get_readable=lambda: (temperature, counter),
+        )
+        self.subject._failed_registers = {}
+        plan = self.subject._build_batch_plan()
+        self.assertEqual(len(plan), 1)
+        start, count, regs16, regs32 = plan[0]
+        self.assertEqual((start, count), (2101, 11))
+        self.assertEqual((plan[0].start, plan[0].count), (start, count))
+        self.assertEqual([entry[:2] for entry in regs16], [(temperature, 0)])
+        self.assertEqual([entry[:3] for entry in regs32], [(counter, 9, 10)])
+
+    def test_strict_mode_reads_one_register_per_request(self) -> None:
+        counter = register(2110, "Value32", high=2110, low=2111)
+        self.subject._strict_reads = True
+        plan = self.subject._build_batch_plan([register(2101), register(2102), counter])
+        self.assertEqual([batch[:2] for batch in plan], [(2101, 1), (2102, 1), (2110, 2)])
+
+    def test_volatile_plan_leaves_settings_out(self) -> None:
+        temperature = register(2101)
+        setpoint = register(2023, scale=0.1, access="Read/Write")
+        self.subject.register_map = SimpleNamespace(
+            get_readable=lambda: (setpoint, temperature),
+        )
+        self.subject._failed_registers = {}
+        self.subject._rebuild_batch_plans()
+        self.assertEqual(self.subject._settings_addresses, {2023})
+        self.assertEqual([batch[:2] for batch in self.subject._batch_plan], [(2023, 1), (2101, 1)])
+        self.assertEqual([batch[:2] for batch in self.subject._volatile_plan], [(2101, 1)])
+
+    def test_adjacent_writes_are_grouped_into_runs(self) -> None:
+        subject = coordinator_subject("_consecutive_runs")
+        runs = subject._consecutive_runs({2049: 215, 2023: 480, 2047: -15, 2048: 20})
+        self.assertEqual(runs, [(2023, [480]), (2047, [-15, 20, 215])])
+
+    def test_rejected_registers_are_left_out_of_the_plan(self) -> None:
+        temperature = register(2101)
+        unsupported = register(2105)
+        self.subject.register_map = SimpleNamespace(
+            get_readable=lambda: (temperature, unsupported),
+        )
+        self.subject._failed_registers = {2105: 0.0}
+        plan = self.subject._build_batch_plan()
+        self.assertEqual(len(plan), 1)
+        self.assertEqual(plan[0][:2], (2101, 1))
+        self.assertEqual([entry[0] for entry in plan[0][2]], [temperature])
+
+    def test_value_converters_follow_type_name_and_scale(self) -> None:
+        convert = self.subject._value_converter
+        self.assertEqual(convert(register(2001, "Enum", scale=0.1))(3), 3)
+        self.assertEqual(convert(register(2002, "Bitmask"))(5), 5)
+        self.assertEqual(convert(register(2101, scale=0.1))(215), 21.5)
+        self.assertEqual(convert(register(2327, scale=0.01))(-7), -0.07)
+        self.assertEqual(convert(register(2090))(1234), 1234)
+        self.assertEqual(convert(register(2361, "Value32", scale=0.1))(4000000001), 400000000.1)
+        self.assertEqual(convert(register(2095, scale=0.5))(3), 1.5)
+        cop = convert(register(2371, name_en="cop_value", scale=0.01))
+        self.assertEqual(cop(463), 4.63)
+        self.assertIsNone(cop(-1))
+
+
+class FakeWriteClient:
+    def __init__(self) -> None:
+        self.calls = []
+
+    async def write_register(self, address, value, device_id):
+        self.calls.append(("FC6", address, [value]))
+        return SimpleNamespace(isError=lambda: False)
+
+    async def write_registers(self, address, values, device_id):
+        self.calls.append(("FC16", address, values))
+        return SimpleNamespace(isError=lambda: False)
+
+
+WRITE_METHODS = (
+    "write_register_by_address",
+    "_is_current_setting",
+    "_async_write_values",
+    "_async_send_write",
+    "_consecutive_runs",
+)
+
+
+def write_subject():
+    """Return a connected coordinator stand-in carrying the write path."""
+    subject = coordinator_subject(*WRITE_METHODS)
+    subject.client = FakeWriteClient()
+    subject.unit_id = 20
+    subject._connected = True
+    subject._reg_by_addr = {}
+    subject._settings_read_at = None
+    subject._polled_at = None
+    return with_write_state(subject)
+
+
+def with_write_state(subject):
+    """Give a coordinator stand-in the state and hooks the write path uses."""
+    subject._pending_writes = None
+    subject._write_lock = asyncio.Lock()
+    subject.refreshes = []
+    subject.written = {}
+
+    async def request_refresh():
+        subject.refreshes.append(True)
+
+    def optimistic_update(address, value):
+        subject.written[address] = value
+        return True
+
+    subject.async_request_refresh = request_refresh
+    subject._optimistic_update_register = optimistic_update
+    subject.async_update_listeners = lambda: None
+    return subject
+
+
+def run_writes(subject, *writes):
+    async def write_all():
+        subject.hass = SimpleNamespace(loop=asyncio.get_running_loop())
+        return await asyncio.gather(
+            *(subject.write_register_by_address(address, value) for address, value in writes)
+        )
+
+    return asyncio.run(write_all())
+
+
+class ModbusWriteCoalescingTests(unittest.TestCase):
+    def test_concurrent_adjacent_writes_share_one_request(self) -> None:
+        subject = write_subject()
+        results = run_writes(subject, (2047, -15), (2048, 20), (2187, 215))
+        self.assertEqual(results, [True, True, True])
+        self.assertEqual(
+            subject.client.calls,
+            [("FC16", 2046, [65521, 20]), ("FC6", 2186, [215])],
+        )
+        self.assertEqual(len(subject.refreshes), 1)
+        self.assertIsNone(subject._pending_writes)
+        self.assertEqual(subject.written, {2047: -15, 2048: 20, 2187: 215})
+
+    def test_written_values_update_the_polled_entries(self) -> None:
+        spec = importlib.util.spec_from_file_location(
+            "kronoterm_modbus_writes", COMPONENT / "modbus_writes.py"
+        )
+        module = importlib.util.module_from_spec(spec)
+        assert spec.loader is not None
+        spec.loader.exec_module(module)
+        setpoint = register(2187, scale=0.1)
+        subject = module.ModbusWriteMixin()
+        subject.register_map = SimpleNamespace(get={2187: setpoint}.get)
+        subject._value_converter = coordinator_subject("_value_converter")._value_converter
+        entry = {"address": 2187, "value": 21.5, "raw": 215}
+        subject._reg_by_addr = {2187: entry}
+        self.assertTrue(subject._optimistic_update_register(2187, 225))
+        self.assertEqual((entry["value"], entry["raw"]), (22.5, 225))
+        self.assertFalse(subject._optimistic_update_register(2023, 480))
+
+    def test_rejected_multi_register_write_falls_back_to_single_writes(self) -> None:
+        for rejection in ("error", "exception"):
+            subject = write_subject()
+
+            async def write_registers(address, values, device_id, rejection=rejection):
+                subject.client.calls.append(("FC16", address, values))
+                if rejection == "exception":
+                    raise OSError("illegal function")
+                return SimpleNamespace(isError=lambda: True)
+
+            subject.client.write_registers = write_registers
+            self.assertEqual(run_writes(subject, (2047, -15), (2048, 20)), [True, True])
+            self.assertEqual(
+                subject.client.calls,
+                [("FC16", 2046, [65521, 20]), ("FC6", 2046, [65521]), ("FC6", 2047, [20])],
+            )
+            self.assertEqual(subject.written, {2047: -15, 2048: 20})
+
+    def test_repeated_writes_to_one_register_send_the_last_value(self) -> None:
+        subject = write_subject()
+        self.assertEqual(run_writes(subject, (2015, 1), (2015, 0)), [True, True])
+        self.assertEqual(subject.client.calls, [("FC6", 2014, [0])])
+
+    def test_toggling_back_to_the_read_value_is_still_sent(self) -> None:
+        subject = write_subject()
+        subject._reg_by_addr = {2015: {"raw": 0}}
+        subject._settings_read_at = subject._polled_at = time.monotonic()
+        self.assertEqual(run_writes(subject, (2015, 1), (2015, 0)), [True, True])
+        self.assertEqual(subject.client.calls, [("FC6", 2014, [0])])
+
+    def test_writes_matching_a_fresh_read_are_skipped(self) -> None:
+        subject = write_subject()
+        subject._reg_by_addr = {2012: {"raw": 1}, 2047: {"raw": -15}}
+        subject._settings_read_at = subject._polled_at = time.monotonic()
+        self.assertEqual(run_writes(subject, (2012, 1), (2047, -15)), [True, True])
+        self.assertEqual(subject.client.calls, [])
+        # A stale read is not trusted
+        subject._settings_read_at = subject._polled_at = time.monotonic() - 3600
+        self.assertEqual(run_writes(subject, (2012, 1)), [True])
+        self.assertEqual(subject.client.calls, [("FC6", 2011, [1])])
+
+    def test_joined_writes_fail_when_the_leader_raises(self) -> None:
+        subject = write_subject()
+
+        async def broken_write(values):
+            raise OSError("socket closed")
+
+        subject._async_write_values = broken_write
+
+        async def write_all():
+            subject.hass = SimpleNamespace(loop=asyncio.get_running_loop())
+            leader = asyncio.ensure_future(subject.write_register_by_address(2047, -15))
+            await asyncio.sleep(0)
+            joined = await subject.write_register_by_address(2048, 20)
+            with self.assertRaises(OSError):
+                await leader
+            return joined
+
+        self.assertFalse(asyncio.run(write_all()))
+        self.assertIsNone(subject._pending_writes)
+
+    def test_joined_writes_fail_when_the_leader_is_cancelled(self) -> None:
+        subject = write_subject()
+
+        async def write_all():
+            subject.hass = SimpleNamespace(loop=asyncio.get_running_loop())
+            leader = asyncio.ensure_future(subject.write_register_by_address(2047, -15))
+            await asyncio.sleep(0)
+            joined = asyncio.ensure_future(subject.write_register_by_address(2048, 20))
+            await asyncio.sleep(0)
+            leader.cancel()
+            return await joined
+
+        self.assertFalse(asyncio.run(write_all()))
+        self.assertEqual(subject.client.calls, [])
+        self.assertIsNone(subject._pending_writes)
+
+
+class FakeReadClient:
+    """Answers FC03 reads with each word's address, rejecting some addresses."""
+
+    def __init__(self, rejected=()) -> None:
+        self.rejected = set(rejected)
+        # Address -> word the device holds, for addresses not answering
+        # with their own number
+        self.words = {}
+        self.calls = []
+        self.connected = True
+
+    async def read_holding_registers(self, address, count, device_id):
+        start = address + 1
+        self.calls.append((start, count))
+        if self.rejected.intersection(range(start, start + count)):
+            return SimpleNamespace(isError=lambda: True)
+        return SimpleNamespace(
+            isError=lambda: False,
+            registers=[self.words.get(word, word) for word in range(start, start + count)],
+        )
+
+
+def poll_subject(registers, rejected=(), *extra_methods):
+    """Return a connected coordinator stand-in carrying the poll path."""
+    subject = coordinator_subject(
+        "_async_update_data",
+        "_read_batch",
+        "_async_split_failed_batch",
+        "_replace_split_batches",
+        "_expire_failed_registers",
+        "_build_batch_plan",
+        "_rebuild_batch_plans",
+        "_value_converter",
+        "_register_span",
+        "_group_registers_into_batches",
+        *extra_methods,
+    )
+    subject.client = FakeReadClient(rejected)
+    subject.unit_id = 20
+    subject.register_map = SimpleNamespace(get_readable=lambda: tuple(registers))
+    subject._strict_reads = False
+    subject._read_semaphore = asyncio.Semaphore(4)
+    subject._decode_signed_words = load_value_utils().SignedWordDecoder()
+    subject._failed_registers = {}
+    subject._batch_plan = []
+    subject._volatile_plan = []
+    subject._settings_read_at = None
+    subject._reg_by_addr = {}
+    subject._feature_flags_detected = True
+    subject._connected = True
+
+    async def ensure_connected():
+        return None
+
+    subject._async_ensure_connected = ensure_connected
+    return subject
+
+
+def poll(subject) -> dict:
+    """Run one poll and return the polled entries keyed by address."""
+    asyncio.run(subject._async_update_data())
+    return subject._reg_by_addr
+
+
+class ModbusPollTests(unittest.TestCase):
+    def test_rejected_gap_is_split_once_per_plan(self) -> None:
+        subject = poll_subject([register(2000), register(2010)], rejected={2005})
+        for _ in range(2):
+            # The full plan, then the volatile plan, each split on first use
+            subject.client.calls.clear()
+            self.assertEqual(set(poll(subject)), {2000, 2010})
+            self.assertEqual(subject.client.calls, [(2000, 11), (2000, 1), (2010, 1)])
+        self.assertEqual(subject._failed_registers, {})
+        subject.client.calls.clear()
+        self.assertEqual(set(poll(subject)), {2000, 2010})
+        self.assertEqual(sorted(subject.client.calls), [(2000, 1), (2010, 1)])
+        subject._settings_read_at -= 3600
+        subject.client.calls.clear()
+        poll(subject)
+        self.assertEqual(sorted(subject.client.calls), [(2000, 1), (2010, 1)])
+
+    def test_rejected_register_is_skipped_until_retry(self) -> None:
+        subject = poll_subject([register(2000), register(2010)], rejected={2010})
+        self.assertEqual(set(poll(subject)), {2000})
+        self.assertEqual(set(subject._failed_registers), {2010})
+        subject.client.calls.clear()
+        poll(subject)
+        self.assertEqual(subject.client.calls, [(2000, 1)])
+
+    def test_failed_registers_expire_after_the_retry_delay(self) -> None:
+        subject = poll_subject([])
+        now = time.monotonic()
+        subject._batch_plan = ["stale"]
+        subject._failed_registers = {2010: now, 2011: now - 601}
+        subject._expire_failed_registers()
+        self.assertEqual(subject._failed_registers, {2010: now})
+        self.assertEqual(subject._batch_plan, [])
+        # Nothing expired: the plan is kept
+        subject._batch_plan = ["current"]
+        subject._expire_failed_registers()
+        self.assertEqual(subject._batch_plan, ["current"])
+
+    def test_settings_are_carried_over_between_reads(self) -> None:
+        setpoint = register(2023, scale=0.1, access="Read/Write")
+        subject = poll_subject([setpoint, register(2101)])
+        first = poll(subject)
+        self.assertEqual(first[2023]["value"], 202.3)
+        subject.client.calls.clear()
+        second = poll(subject)
+        # Only the measurement is read; the setting keeps its last entry
+        self.assertEqual(subject.client.calls, [(2101, 1)])
+        self.assertIs(second[2023], first[2023])
+        self.assertEqual(second[2101]["raw"], 2101)
+        # A stale settings read sends the next poll back to the full plan
+        subject._settings_read_at -= 3600
+        subject.client.calls.clear()
+        poll(subject)
+        self.assertEqual(sorted(subject.client.calls), [(2023, 1), (2101, 1)])
+
+    def test_feature_flags_latch_once_their_registers_were_read(self) -> None:
+        registers = [register(2034), register(2110), register(2111), register(2112)]
+        subject = poll_subject(registers, rejected={2112})
+        subject._feature_flags_detected = False
+        subject.detections = 0
+
+        def update_feature_flags(data):
+            subject.detections += 1
+
+        subject._update_feature_flags = update_feature_flags
+        poll(subject)
+        self.assertFalse(subject._feature_flags_detected)
+        # Loop 4 answers again after its retry delay
+        subject.client.rejected.clear()
+        subject._failed_registers = {}
+        subject._batch_plan = []
+        poll(subject)
+        self.assertTrue(subject._feature_flags_detected)
+        poll(subject)
+        self.assertEqual(subject.detections, 2)
+
+    def test_write_after_a_carried_over_setting_is_sent(self) -> None:
+        setpoint = register(2023, access="Read/Write")
+        subject = with_write_state(poll_subject([setpoint, register(2101)], (), *WRITE_METHODS))
+        writes = FakeWriteClient()
+        subject.client.write_register = writes.write_register
+        subject.client.words[2023] = 1
+        poll(subject)
+        # The latest poll read the setting, so rewriting it is skipped
+        self.assertEqual(run_writes(subject, (2023, 1)), [True])
+        self.assertEqual(writes.calls, [])
+        # The next poll carries the setting over; meanwhile it is changed
+        # on the controller panel, and the old value is written back
+        poll(subject)
+        subject.client.words[2023] = 0
+        self.assertEqual(run_writes(subject, (2023, 1)), [True])
+        self.assertEqual(writes.calls, [("FC6", 2022, [1])])
+
+
+class ModbusUpdateLoopTests(unittest.TestCase):
+    def test_results_are_processed_once_after_all_batches(self) -> None:
+        """Scaling runs once per poll, not once per batch."""
+        text = source("modbus_coordinator.py")
+        tree = ast.parse(text)
+        updater = next(
+            node
+            for node in ast.walk(tree)
+            if isinstance(node, ast.AsyncFunctionDef) and node.name == "_async_update_data"
+        )
+        outer_loops = [node for node in ast.walk(updater) if isinstance(node, ast.For)]
+        nested = {
+            id(inner)
+            for loop in outer_loops
+            for inner in ast.walk(loop)
+            if inner is not loop and isinstance(inner, ast.For)
+        }
+        process_loops = [
+            loop
+            for loop in outer_loops
+            if "register_values" in ast.get_source_segment(text, loop.iter)
+        ]
+        self.assertEqual(len(process_loops), 1)
+        self.assertNotIn(id(process_loops[0]), nested)
+
+    def test_failed_batches_do_not_abort_the_poll(self) -> None:
+        """Batch reads are gathered with return_exceptions=True."""
+        text = source("modbus_coordinator.py")
+        updater = next(
+            node
+            for node in ast.walk(ast.parse(text))
+            if isinstance(node, ast.AsyncFunctionDef) and node.name == "_async_update_data"
+        )
+        gathers = [
+            node
+            for node in ast.walk(updater)
+            if isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Attribute)
+            and node.func.attr == "gather"
+        ]
+        self.assertEqual(len(gathers), 1)
+        self.assertTrue(
+            any(
+                keyword.arg == "return_exceptions"
+                and isinstance(keyword.value, ast.Constant)
+                and keyword.value.value is True
+                for keyword in gathers[0].keywords
+            )
+        )
+        # Only successful responses reach the decode loop
+        self.assertIn("isinstance(result, Exception)", ast.get_source_segment(text, updater))
+
+
+class RegisterMapLookupTests(unittest.TestCase):
+    def test_write_setters_resolve_by_name(self) -> None:
+        spec = importlib.util.spec_from_file_location(
+            "kronoterm_register_map", COMPONENT / "register_map.py"
+        )
+        module = importlib.util.module_from_spec(spec)
+        assert spec.loader is not None
+        spec.loader.exec_module(module)
+        register_map = module.RegisterMap(json.loads(source("kronoterm.json")))
+        expected = {
+            "system_on": 2012,
+            "operation_program_select": 2013,
+            "system_temperature_correction": 2014,
+            "dhw_quick_heating_enable": 2015,
+            "thermal_disinfection": 2301,
+        }
+        for name, address in expected.items():
+            self.assertEqual(register_map.get_by_name(name).address, address)
+        self.assertIsNone(register_map.get_by_name("not_a_register"))
+        self.assertEqual(register_map.resolve("not_a_register", 2012).name_en, "system_on")
+        # Definitions are shared by every entity, so they must stay read-only
+        with self.assertRaises(AttributeError):
+            register_map.get(2012).scale = 0.1
+
+    def test_bundled_maps_have_unique_addresses(self) -> None:
+        for name in ("kronoterm.json", "kronoterm_tt3000.json"):
+            addresses = [reg["address"] for reg in json.loads(source(name))["registers"]]
+            self.assertEqual(len(addresses), len(set(addresses)), name)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -31,6 +31,19 @@ def class_method_source(filename: str, class_name: str, method_name: str) -> str
     raise AssertionError(f"Method {class_name}.{method_name} not found in {filename}")
 
 
+def module_constant(filename: str, name: str) -> Any:
+    """Return the literal value assigned to a module-level constant."""
+    for node in ast.parse(source(filename)).body:
+        if (
+            isinstance(node, ast.Assign)
+            and len(node.targets) == 1
+            and isinstance(node.targets[0], ast.Name)
+            and node.targets[0].id == name
+        ):
+            return ast.literal_eval(node.value)
+    raise AssertionError(f"Constant {name} not found in {filename}")
+
+
 def load_value_utils():
     spec = importlib.util.spec_from_file_location(
         "kronoterm_value_utils", COMPONENT / "value_utils.py"
@@ -138,22 +151,26 @@ class PoolLoopSupport(unittest.TestCase):
 
     def test_modbus_offset_write_maps_pool_page_ten(self) -> None:
         """Pool eco/comfort offsets write to their page-10 registers."""
+        offsets = module_constant("modbus_writes.py", "PAGE_OFFSET_REGISTERS")
+        self.assertEqual(offsets[(10, "circle_eco_offset")], 2086)
+        self.assertEqual(offsets[(10, "circle_comfort_offset")], 2087)
         offset = class_method_source(
             "modbus_writes.py", "ModbusWriteMixin", "async_set_offset"
         )
-        self.assertIn('(10, "circle_eco_offset"): 2086', offset)
-        self.assertIn('(10, "circle_comfort_offset"): 2087', offset)
+        self.assertIn("PAGE_OFFSET_REGISTERS.get((page, param_name))", offset)
 
     def test_modbus_setpoint_and_mode_write_maps_pool_page_ten(self) -> None:
         """Pool setpoint and operation mode resolve to their page-10 registers."""
+        self.assertEqual(module_constant("modbus_writes.py", "PAGE_SETPOINT_REGISTERS")[10], 2079)
         setpoint = class_method_source(
             "modbus_writes.py", "ModbusWriteMixin", "async_set_temperature"
         )
-        self.assertIn("10: 2079", setpoint)
+        self.assertIn("PAGE_SETPOINT_REGISTERS.get(page)", setpoint)
+        self.assertEqual(module_constant("modbus_writes.py", "PAGE_MODE_REGISTERS")[10], 2081)
         mode = class_method_source(
             "modbus_writes.py", "ModbusWriteMixin", "async_set_loop_mode_by_page"
         )
-        self.assertIn("10: 2081", mode)
+        self.assertIn("PAGE_MODE_REGISTERS.get(page)", mode)
 
     def test_modbus_pool_climate_class_wires_the_right_registers(self) -> None:
         """The pool climate reads temperature/setpoint and writes the pool setpoint."""
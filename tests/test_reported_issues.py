@@ -170,10 +170,11 @@ class ReportedIssueRegressions(unittest.TestCase):
         self.assertEqual(module.normalize_performance_factor(0), 0.0)
         self.assertIsNone(module.normalize_performance_factor(-1))
 
-        coordinator = class_method_source(
-            "modbus_coordinator.py", "ModbusCoordinator", "_async_update_data"
+        converter = class_method_source(
+            "modbus_coordinator.py", "ModbusCoordinator", "_value_converter"
         )
-        self.assertIn("normalize_performance_factor(raw_value)", coordinator)
+        self.assertIn("PERFORMANCE_FACTOR_NAMES", converter)
+        self.assertIn("return normalize_performance_factor", converter)
 
     def test_issue_59_modbus_temperature_spikes_are_rejected(self) -> None:
         """Modbus temperature sensors ignore implausible one-off high samples."""
@@ -190,7 +191,7 @@ class ReportedIssueRegressions(unittest.TestCase):
 
         sensor = source("sensor.py")
         self.assertIn("is_measured_temperature_plausible", sensor)
-        self.assertIn('self._unit == "°C"', sensor)
+        self.assertIn('self._meta.unit == "°C"', sensor)
 
     def test_issue_52_value32_reader_combines_both_unsigned_words(self) -> None:
         """Live totals independently reproduce the controller's SCOP."""